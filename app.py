@@ -1,20 +1,36 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
-from flask_session import Session
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, Response, stream_with_context, g, abort, has_app_context, before_render_template, template_rendered
+from markupsafe import Markup
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 import gspread
 import backoff
-from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime, timedelta
 import os
+import copy
 import json
 from dotenv import load_dotenv
 import logging
+import queue
+import threading
+import time
+import uuid
+from store import PickConflict, create_store
+from ratelimit import RateLimited, SheetsRateLimiter
+from sheets_client import SheetsClientManager
+from metrics import REGISTRY, REQUEST_LATENCY, REQUESTS, AUTOPICK_SKEW, count_backoff, debug_sampled
+from engine import DraftEngine
+from availability import AvailabilityIndex
+from snapshot import DraftSnapshot
+from cache import FragmentCache, SWRCache
+from scheduler import TurnScheduler
+from leader import LeaderElection
+from events import DraftEventBroker, DraftStateHistory, VersionWatcher, format_sse
+from registry import Draft, DraftRegistry, LeagueConfig, active_draft, load_league_configs
+from sessions import configure_sessions, load_secret_key
+from scoring import EventScores, ScoreFeed, TeamStandings
+from profiler import RequestProfiler, traced
 
 app = Flask(__name__)
-app.config['SESSION_TYPE'] = 'filesystem'
-app.config['SECRET_KEY'] = os.urandom(24)
-Session(app)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,15 +45,46 @@ CURRENT_EVENT = {
 load_dotenv(encoding='utf-8')
 SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
 
+# Sessions: 'cookie' (default) keeps the login in a signed cookie, so requests do no session I/O;
+# 'sqlite' keeps sessions server-side with TTL eviction; 'filesystem' is the old flask_session setup.
+# The signing key must survive restarts and be shared by every worker: set SECRET_KEY, or one is
+# generated once into SECRET_KEY_FILE.
+app.config['SECRET_KEY'] = os.getenv('SECRET_KEY') or load_secret_key(os.getenv('SECRET_KEY_FILE', 'secret.key'))
+app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=int(os.getenv('SESSION_LIFETIME_DAYS', '31')))
+configure_sessions(app, os.getenv('SESSION_BACKEND', 'cookie'), os.getenv('SESSION_DB_PATH', 'sessions.db'))
+
 scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
 service_account_json = os.getenv('SERVICE_ACCOUNT_JSON')
 if not service_account_json:
     raise ValueError("SERVICE_ACCOUNT_JSON environment variable is not set")
-creds = ServiceAccountCredentials.from_json_keyfile_dict(json.loads(service_account_json), scope)
-gc = gspread.authorize(creds)
-sheet = gc.open_by_key(SPREADSHEET_ID)
-worksheet = sheet.worksheet('Golfers')
-draft_worksheet = sheet.worksheet('Draft Board')
+
+# Draft storage: 'sqlite' (default) keeps a local store as the source of truth and mirrors
+# writes to the Sheet in the background; 'sheets' reads and writes the Sheet directly.
+# Running several gunicorn workers requires 'sqlite' with a file path: the database is
+# the state shared between workers.
+DRAFT_STORE = os.getenv('DRAFT_STORE', 'sqlite')
+DRAFT_DB_PATH = os.getenv('DRAFT_DB_PATH', 'draft.db')
+
+# Client-side budget for the Sheets API quotas (per minute, per process), shared by every draft.
+# Pick writes take priority; polling reads over budget are answered from cache instead of waiting.
+sheets_limiter = SheetsRateLimiter(
+    read_per_minute=int(os.getenv('SHEETS_READS_PER_MINUTE', 60)),
+    write_per_minute=int(os.getenv('SHEETS_WRITES_PER_MINUTE', 60))
+)
+
+# Google client: authorized and worksheets opened on first use, so importing the app does no
+# network I/O. PREWARM_DRAFTS opens the default draft in the background right after startup.
+sheets_clients = SheetsClientManager(
+    lambda: json.loads(service_account_json), scope, sheets_limiter,
+    timeout=float(os.getenv('SHEETS_TIMEOUT', 30))
+)
+
+# Live scoring: round-by-round scores for the event come from SCORES_SOURCE (a CSV/JSON file or a
+# JSON feed URL); a league can name its own source as "scores" in its event config.
+SCORES_SOURCE = os.getenv('SCORES_SOURCE')
+SCORES_POLL_INTERVAL = int(os.getenv('SCORES_POLL_INTERVAL', 60))
+
+PREWARM_DRAFTS = os.getenv('PREWARM_DRAFTS', 'true').lower() in ('1', 'true', 'yes')
 
 user_player_mapping = {
     'user1': 'Stephen',
@@ -68,283 +115,394 @@ USER_CREDENTIALS = {
     'admin': 'daboss'
 }
 TURN_DURATION = 180  # 3 minutes in seconds
+HEARTBEAT_INTERVAL = 5  # Seconds between clock heartbeats on /draft_stream
+
+# Multi-league hosting: the draft configured above is served at the root URLs as 'default';
+# further leagues come from LEAGUES_FILE and are served under /drafts/<draft_id>/.
+# Each draft has its own store, cache, turn engine and stream, opened on first use and
+# evicted least-recently-used once idle.
+DEFAULT_DRAFT_ID = 'default'
+LEAGUES_FILE = os.getenv('LEAGUES_FILE', 'leagues.json')
+DRAFTS_DIR = os.getenv('DRAFTS_DIR', 'drafts')
+MAX_OPEN_DRAFTS = int(os.getenv('MAX_OPEN_DRAFTS', 32))
+MAX_DRAFT_CACHE_MB = int(os.getenv('MAX_DRAFT_CACHE_MB', 256))
+
+league_configs = {
+    DEFAULT_DRAFT_ID: LeagueConfig(DEFAULT_DRAFT_ID, SPREADSHEET_ID, CURRENT_EVENT, user_player_mapping, USER_CREDENTIALS, DRAFT_DB_PATH)
+}
+league_configs.update(load_league_configs(LEAGUES_FILE, DRAFTS_DIR))
 
-# Caching variables
-cached_picks = None
-cached_golfers = None
-cached_draft_order = None
-cached_draft_start_time = None
-last_picks_update = None
-last_golfers_update = None
-last_draft_order_update = None
-last_draft_start_time_update = None
+# Caching: stale-while-revalidate with one in-flight fetch per key
 CACHE_DURATION = timedelta(seconds=30)  # Increase cache duration
 
+def current_draft():
+    """The draft being served: the request's draft, or the one a background thread was bound to."""
+    if has_app_context() and 'draft' in g:
+        return g.draft
+    draft = active_draft.get()
+    if draft is None:
+        raise RuntimeError("No active draft")
+    return draft
+
+def session_user_key():
+    """Session key holding the logged-in user; each league has its own login."""
+    draft_id = current_draft().draft_id
+    return 'username' if draft_id == DEFAULT_DRAFT_ID else f'username:{draft_id}'
+
+def draft_route(rule, **options):
+    """Register a view at rule and at its /drafts/<draft_id> namespaced twin."""
+    def decorator(view):
+        app.route(rule, **options)(view)
+        app.route(f'/drafts/<draft_id>{rule}', **options)(view)
+        return view
+    return decorator
+
+# Admin-controlled request tracing (/admin/profiler); per worker process and off by default
+profiler = RequestProfiler(max_traces=int(os.getenv('PROFILER_MAX_TRACES', 20)))
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    profiler.begin(request.method, request.path)
+
+@app.after_request
+def record_request_metrics(response):
+    # Streaming responses are timed to their first byte
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_LATENCY.observe(time.perf_counter() - started, route=route, method=request.method)
+        REQUESTS.inc(route=route, method=request.method, status=response.status_code)
+        profiler.end(route, response.status_code)
+    return response
+
+@app.teardown_request
+def end_request_trace(exc=None):
+    # Requests that raised never reach after_request
+    profiler.end(request.url_rule.rule if request.url_rule else 'unmatched', 500 if exc else None)
+
+@before_render_template.connect_via(app)
+def start_render_span(sender, template, context, **extra):
+    trace = profiler.current()
+    if trace is not None:
+        trace.push(f'render.{template.name}')
+
+@template_rendered.connect_via(app)
+def end_render_span(sender, template, context, **extra):
+    trace = profiler.current()
+    if trace is not None:
+        trace.pop()
+
+@app.url_value_preprocessor
+def pull_draft_id(endpoint, values):
+    g.draft_id = values.pop('draft_id', DEFAULT_DRAFT_ID) if values else DEFAULT_DRAFT_ID
+
+@app.url_defaults
+def add_draft_id(endpoint, values):
+    draft_id = g.get('draft_id') if has_app_context() else None
+    if draft_id and draft_id != DEFAULT_DRAFT_ID and 'draft_id' not in values \
+            and app.url_map.is_endpoint_expecting(endpoint, 'draft_id'):
+        values['draft_id'] = draft_id
+
+@app.before_request
+def load_draft():
+    if request.endpoint in (None, 'static'):
+        return
+    try:
+        g.draft = drafts.get(g.draft_id, use=True)
+    except KeyError:
+        abort(404)
+    except Exception as e:
+        logger.error(f"Error opening draft {g.draft_id}: {str(e)}")
+        return "Internal Server Error", 500
+
+@app.teardown_request
+def release_draft(exc=None):
+    # The draft can be evicted (and its store closed) once no request is using it
+    draft = g.pop('draft', None)
+    if draft is not None:
+        drafts.release(draft)
+
+@traced('load.refresh_snapshot')
+def refresh_snapshot():
+    """Fetch both worksheets from the draft store in one call and parse them into a snapshot.
+
+    Not retried here: while Sheets is over quota the cached snapshot is served and the
+    cache retries with a backoff.
+    """
+    draft = current_draft()
+    version, exact, golfer_records, draft_headers, draft_records = draft.store.fetch_versioned()
+    snapshot = DraftSnapshot(
+        golfer_records, draft_headers, draft_records, draft.user_player_mapping.values(), version, draft.cache.peek('snapshot'), exact
+    )
+    debug_sampled(logger, 20, "Loaded golfers: %s", snapshot.golfers)
+    debug_sampled(logger, 20, "Loaded draft picks: %s", snapshot.picks)
+    return snapshot
+
+@traced('load.snapshot')
+def get_snapshot():
+    """Return the current draft snapshot; a stale one is served while a single background refresh runs."""
+    draft = current_draft()
+    # Background refreshes run on the cache's own threads, so the loader carries the draft with it
+    loader = draft.bind(refresh_snapshot)
+    try:
+        snapshot = draft.cache.get('snapshot', loader, CACHE_DURATION.total_seconds())
+        if snapshot.version != draft.store.state_version():
+            # Another worker committed a pick since this snapshot was taken
+            invalidate_snapshot()
+            snapshot = draft.cache.get('snapshot', loader, CACHE_DURATION.total_seconds())
+        return snapshot
+    except Exception as e:
+        cached_snapshot = draft.cache.peek('snapshot')
+        if not cached_snapshot:
+            logger.error(f"Error loading draft snapshot: {str(e)}")
+            raise
+        # The cache logs a failed refresh once per outage and backs off (RefreshBackoff) until it retries
+        debug_sampled(logger, 20, "Returning cached draft snapshot due to error: %s", e)
+        fallback = copy.copy(cached_snapshot)
+        fallback.fallback = True
+        return fallback
+
+def invalidate_snapshot():
+    current_draft().cache.invalidate('snapshot')
+
 def ensure_draft_columns():
     """Ensure the 'Pick Time' and 'Draft Start Time' columns exist in the Draft Board worksheet."""
+    store = current_draft().store
     try:
-        headers = draft_worksheet.row_values(1)
-        if 'Pick Time' not in headers:
-            draft_worksheet.update_cell(1, len(headers) + 1, 'Pick Time')
-            logger.info("Added 'Pick Time' column to Draft Board worksheet")
-        if 'Draft Start Time' not in headers:
-            draft_worksheet.update_cell(1, len(headers) + 1, 'Draft Start Time')
-            logger.info("Added 'Draft Start Time' column to Draft Board worksheet")
+        headers = get_snapshot().draft_headers
+        missing = [column for column in ('Pick Time', 'Draft Start Time') if column not in headers]
+        # A column the store already has only means the cached snapshot predates it: adding the
+        # column invalidated the snapshot, or the next refresh picks it up
+        added = [column for column in missing if store.add_draft_column(column)]
+        for column in added:
+            logger.info(f"Added '{column}' column to Draft Board worksheet")
+        if added:
+            store.bump_state_version()
+            invalidate_snapshot()
     except Exception as e:
         logger.error(f"Error ensuring draft columns: {str(e)}")
         raise
 
 def get_draft_start_time():
-    """Get or set the draft start time from the Draft Board worksheet with caching, enforcing 8:00 PM EDT start."""
-    global cached_draft_start_time, last_draft_start_time_update
+    """Get or set the draft start time from the Draft Board worksheet, enforcing 8:00 PM EDT start."""
+    snapshot = get_snapshot()
+    if 'Draft Start Time' not in snapshot.draft_headers:
+        logger.error("Draft Start Time column not found")
+        return None
+    if snapshot.draft_start_time:
+        return snapshot.draft_start_time
+
+    # Enforce draft start at 8:00 PM EDT
     now = datetime.now()
-    if cached_draft_start_time and last_draft_start_time_update and (now - last_draft_start_time_update) < CACHE_DURATION:
-        logger.info("Returning cached draft start time")
-        return cached_draft_start_time
-
-    try:
-        headers = draft_worksheet.row_values(1)
-        draft_start_col = headers.index('Draft Start Time') + 1 if 'Draft Start Time' in headers else None
-        if not draft_start_col:
-            logger.error("Draft Start Time column not found")
+    scheduled_start = datetime(2025, 6, 8, 20, 0, 0)  # 8:00 PM EDT
+    if now < scheduled_start:
+        logger.info(f"Draft not started yet, current time {now}, scheduled start {scheduled_start}")
+        return None  # Prevent timer/picks until start time
+
+    draft = current_draft()
+    # Requests on the first turn would each write (and restart) the start time while the snapshot lags
+    with draft.start_time_lock:
+        if draft.draft_start_time:
+            return draft.draft_start_time
+        start_time = now.replace(microsecond=0)
+        first_player = next(iter(draft.user_player_mapping.values()))
+        if not snapshot.has_player(first_player):
+            logger.error(f"{first_player} not found in draft board to set Draft Start Time")
             return None
-
-        values = draft_worksheet.col_values(draft_start_col)[1:]  # Skip header
-        for value in values:
-            if value:
-                cached_draft_start_time = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-                last_draft_start_time_update = now
-                return cached_draft_start_time
-
-        # Enforce draft start at 8:00 PM EDT
-        scheduled_start = datetime(2025, 6, 8, 20, 0, 0)  # 8:00 PM EDT
-        if now < scheduled_start:
-            logger.info(f"Draft not started yet, current time {now}, scheduled start {scheduled_start}")
-            return None  # Prevent timer/picks until start time
-
-        start_time = now
-        player_row = next((i + 2 for i, row in enumerate(draft_worksheet.get_all_records()) if row.get('Player') == user_player_mapping['user1']), None)
-        if player_row:
-            draft_worksheet.update_cell(player_row, draft_start_col, start_time.strftime('%Y-%m-%d %H:%M:%S'))
-            logger.info(f"Set Draft Start Time to {start_time} for {user_player_mapping['user1']}")
-            cached_draft_start_time = start_time
-            last_draft_start_time_update = now
-            return start_time
-        else:
-            logger.error(f"{user_player_mapping['user1']} not found in draft board to set Draft Start Time")
+        try:
+            update_draft_cell(first_player, 'Draft Start Time', start_time.strftime('%Y-%m-%d %H:%M:%S'))
+        except RateLimited as e:
+            logger.warning(f"Rate limited in get_draft_start_time: {str(e)}")
             return None
-    except gspread.exceptions.APIError as e:
-        if e.response and e.response.status_code == 429:
-            logger.error(f"APIError 429 in get_draft_start_time: {str(e)}")
-            return cached_draft_start_time  # Return cached value on quota exceeded
-        raise
+        except gspread.exceptions.APIError as e:
+            if e.response and e.response.status_code == 429:
+                logger.error(f"APIError 429 in get_draft_start_time: {str(e)}")
+                return None
+            raise
+        logger.info(f"Set Draft Start Time to {start_time} for {first_player}")
+        draft.draft_start_time = start_time
+        draft.store.bump_state_version()
+        invalidate_snapshot()
+        # The first turn's clock starts now; only file-backed sqlite has a version watcher to notice
+        draft.turn_scheduler.rearm()
+    return start_time
 
 def get_draft_order():
-    """Get the draft order from the Draft Board worksheet with caching."""
-    global cached_draft_order, last_draft_order_update
-    now = datetime.now()
-    if cached_draft_order and last_draft_order_update and (now - last_draft_order_update) < CACHE_DURATION:
-        logger.info("Returning cached draft order")
-        return cached_draft_order
+    """Get the draft order from the current draft snapshot."""
+    return get_snapshot().draft_order
 
-    try:
-        records = draft_worksheet.get_all_records()
-        if not records:
-            logger.info("No records found in Draft Board, using default player mapping")
-            cached_draft_order = [{'Player': player} for player in user_player_mapping.values()]
-        else:
-            order = [r for r in records if 'Player' in r and 'Draft Order' in r and r['Draft Order']]
-            if not order:
-                logger.info("No valid draft order entries, using default player mapping")
-                cached_draft_order = [{'Player': player} for player in user_player_mapping.values()]
-            else:
-                sorted_order = sorted(order, key=lambda x: int(float(str(x['Draft Order']).strip())))
-                logger.info(f"Draft order: {sorted_order}")
-                cached_draft_order = sorted_order if order else [{'Player': player} for player in user_player_mapping.values()]
-        last_draft_order_update = now
-        return cached_draft_order
-    except (ValueError, KeyError, TypeError) as e:
-        logger.error(f"Error parsing draft order: {str(e)}, falling back to default order")
-        return [{'Player': player} for player in user_player_mapping.values()]
-
-@backoff.on_exception(backoff.expo, gspread.exceptions.APIError, max_tries=8, max_time=120)  # Increase max_time to 120s
 def load_golfers():
-    """Load golfers from the Google Sheet with caching."""
-    global cached_golfers, last_golfers_update
-    now = datetime.now()
-    if cached_golfers and last_golfers_update and (now - last_golfers_update) < CACHE_DURATION:
-        logger.info("Returning cached golfers")
-        return cached_golfers
+    """Load golfers, sorted by ranking, from the current draft snapshot."""
+    return get_snapshot().golfers
 
+def load_draft_picks():
+    """Load draft picks from the current draft snapshot."""
+    return get_snapshot().picks
+
+@traced('availability')
+def get_availability(picks):
+    """Return the golfer availability index for the current field, synced to the given picks list."""
+    draft = current_draft()
+    golfers = load_golfers()
+    if draft.availability is None or draft.availability.golfers is not golfers:
+        draft.availability = AvailabilityIndex(golfers)
+    draft.availability.sync(picks)
+    return draft.availability
+
+@backoff.on_exception(backoff.expo, gspread.exceptions.APIError, max_tries=4, max_time=15, on_backoff=count_backoff)
+def update_draft_row(player, values):
+    """Update several of a player's cells in the Draft Board in one store write, with retries."""
     try:
-        golfers = worksheet.get_all_records()
-        logger.info(f"Loaded golfers: {golfers}")
-        cached_golfers = sorted(golfers, key=lambda x: int(x['Ranking']))
-        last_golfers_update = now
-        return cached_golfers
+        current_draft().store.set_draft_values(player, values)
+        logger.info(f"Updated {player} with values {values}")
     except Exception as e:
-        logger.error(f"Error loading golfers: {str(e)}")
-        if cached_golfers:
-            logger.info("Returning cached golfers due to error")
-            return cached_golfers
+        logger.error(f"Error updating {player} with values {values}: {str(e)}")
         raise
 
-@backoff.on_exception(backoff.expo, gspread.exceptions.APIError, max_tries=8, max_time=120)  # Increase max_time to 120s
-def load_draft_picks():
-    """Load draft picks from the Google Sheet with caching."""
-    global cached_picks, last_picks_update
-    now = datetime.now()
-    if cached_picks and last_picks_update and (now - last_picks_update) < CACHE_DURATION:
-        logger.info("Returning cached draft picks")
-        return cached_picks
+def update_draft_cell(player, column, value):
+    """Update a player's cell in the Draft Board through the draft store with retries."""
+    update_draft_row(player, {column: value})
 
+@backoff.on_exception(backoff.expo, gspread.exceptions.APIError, max_tries=4, max_time=15, on_backoff=count_backoff)
+def record_pick(player, pick_number, golfer, pick_time, source, expected_picks=None, token=None):
+    """Claim and record a pick in one store write, with retries; returns (state version, duplicate)."""
     try:
-        draft_worksheet = sheet.worksheet('Draft Board')
-        records = draft_worksheet.get_all_records()
-        picks = []
-        for record in records:
-            player = record.get('Player')
-            pick_time = record.get('Pick Time', '')
-            for pick_num in range(1, 4):
-                pick_key = f'Pick {pick_num}'
-                golfer = record.get(pick_key)
-                if golfer:
-                    picks.append({
-                        'Player': player,
-                        'Golfer': golfer,
-                        'Pick Number': pick_num,
-                        'Pick Time': pick_time
-                    })
-        logger.info(f"Loaded draft picks: {picks}")
-        cached_picks = picks
-        last_picks_update = now
-        return picks
-    except gspread.exceptions.APIError as e:
-        if e.response and e.response.status_code == 429:
-            logger.error(f"APIError 429 in load_draft_picks: {str(e)}")
-            if cached_picks:
-                logger.info("Returning cached draft picks due to quota exceeded")
-                return cached_picks
+        result = current_draft().store.record_pick(player, pick_number, golfer, pick_time, source, expected_picks, token)
+        logger.info(f"Recorded {source} pick {pick_number} for {player}: {golfer}")
+        return result
+    except PickConflict as e:
+        logger.warning(f"Rejected {source} pick {pick_number} for {player}: {str(e)}")
         raise
-
-@backoff.on_exception(backoff.expo, gspread.exceptions.APIError, max_tries=8, max_time=60)
-def update_draft_cell(player_row, column, value):
-    """Update a cell in the Draft Board worksheet with retries."""
-    try:
-        draft_worksheet.update_cell(player_row, column, value)
-        logger.info(f"Updated cell at row {player_row}, column {column} with value {value}")
     except Exception as e:
-        logger.error(f"Error updating cell at row {player_row}, column {column}: {str(e)}")
+        logger.error(f"Error recording {source} pick {pick_number} for {player}: {str(e)}")
         raise
 
+@traced('pick.commit')
+def commit_pick(player, pick_number, golfer, source, expected_picks=None, token=None):
+    """Commit a pick with compare-and-set in the store, then advance the draft state.
+
+    source is 'pick', 'autopick' or 'admin'. expected_picks is the number of picks
+    the caller validated the turn against; token makes client retries idempotent.
+    Raises PickConflict if the slot or golfer was taken or the draft moved on.
+    """
+    pick_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    version, duplicate = record_pick(player, pick_number, golfer, pick_time, source, expected_picks, token)
+    if duplicate:
+        logger.info(f"Pick token {token} was already committed, treating the retry as done")
+        return None
+    availability = current_draft().availability
+    if availability:
+        availability.draft(golfer)
+    mark_state_changed(player, pick_time, version)
+    return pick_time
+
+def pick_already_committed(token, player=None):
+    """True if a pick was already committed with this token, i.e. the request is a client retry.
+
+    Checked before the turn and availability checks, which a committed pick
+    would fail. Raises PickConflict if the token was used for another player.
+    """
+    if not token:
+        return False
+    committed = current_draft().store.pick_for_token(token)
+    if committed is None:
+        return False
+    if player is not None and committed[0] != player:
+        raise PickConflict("This pick token was already used for a different pick")
+    logger.info(f"Pick token {token} was already committed ({committed[0]}: {committed[2]}), treating the retry as done")
+    return True
+
+def mark_state_changed(player, pick_time, version):
+    """Invalidate the draft snapshot and advance the turn engine after a pick committed at the given state version."""
+    draft = current_draft()
+    invalidate_snapshot()
+    if draft.engine:
+        draft.engine.commit(player, pick_time, version)
+    logger.info(f"Draft state version is now {version}")
+    draft.turn_scheduler.rearm()
+    return version
+
+def queued_pick(player, picks):
+    """First golfer in the player's pick queue who is still available, or None."""
+    availability = get_availability(picks)
+    for golfer in current_draft().store.pick_queue(player):
+        if availability.is_available(golfer):
+            return golfer
+    return None
+
 def perform_autopick(current_player, current_pick_number, draft_order, picks):
-    """Perform an autopick for the current player."""
+    """Pick for the current player: their first available queued golfer, else the best-ranked one."""
     try:
-        golfers = load_golfers()
-        available_golfers = [g for g in golfers if g['Golfer Name'] not in [p['Golfer'] for p in picks]]
-        logger.info(f"Available golfers for autopick: {available_golfers}")
-        if not available_golfers:
-            logger.warning("No golfers available for autopick")
-            return False
-
-        golfer = min(available_golfers, key=lambda x: int(x['Ranking']))['Golfer Name']
-        player_row = next((i + 2 for i, row in enumerate(draft_worksheet.get_all_records()) if row['Player'] == current_player), None)
-        if not player_row:
+        golfer = queued_pick(current_player, picks)
+        source = 'queue'
+        if golfer is None:
+            best_available = get_availability(picks).best_available()
+            if not best_available:
+                logger.warning("No golfers available for autopick")
+                return False
+            golfer = best_available['Golfer Name']
+            source = 'autopick'
+        if not get_snapshot().has_player(current_player):
             logger.error("Player not found in draft board for autopick")
             return False
 
-        column = f'Pick {current_pick_number}'
-        pick_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        pick_time_col = draft_worksheet.find('Pick Time')
-        if pick_time_col:
-            update_draft_cell(player_row, pick_time_col.col, pick_time)
-        else:
+        if 'Pick Time' not in get_snapshot().draft_headers:
             logger.error("Pick Time column not found during autopick")
             return False
 
-        update_draft_cell(player_row, draft_worksheet.find(column).col, golfer)
-        logger.info(f"Autopick successful: {current_player} picked {golfer}")
-        # Invalidate cache after autopick
-        global cached_picks, last_picks_update
-        cached_picks = None
-        last_picks_update = None
+        commit_pick(current_player, current_pick_number, golfer, source, expected_picks=len(picks))
+        logger.info(f"Autopick ({source}) successful: {current_player} picked {golfer}")
         return True
     except Exception as e:
         logger.error(f"Error during autopick: {str(e)}")
         return False
 
-def get_current_turn(picks, draft_order):
-    """Determine whose turn it is and the remaining time, performing autopick if necessary."""
+def get_draft_engine(picks, draft_order, version):
+    """Return the turn engine for this draft order, synced to the picks list of the snapshot at version."""
+    draft = current_draft()
+    if draft.engine is None or not draft.engine.matches(draft_order):
+        draft.engine = DraftEngine(draft_order, rounds=3, turn_duration=TURN_DURATION)
+        logger.info(f"Built snake draft schedule with {len(draft.engine.schedule)} picks for {draft.draft_id}")
+    draft.engine.sync(picks, version)
+    return draft.engine
+
+@traced('turn.get_current_turn')
+def get_current_turn(picks, draft_order, version):
+    """Determine whose turn it is and the remaining time; expired turns are autopicked by the turn scheduler."""
     if not draft_order:
         logger.info("Draft order is empty")
         return None, None, TURN_DURATION
 
-    player_picks = {player['Player'] if isinstance(player, dict) else player: [] for player in draft_order}
-    for pick in picks:
-        player = pick['Player']
-        if player in player_picks:
-            player_picks[player].append(pick)
+    engine = get_draft_engine(picks, draft_order, version)
+    player_name, pick_number = engine.current_turn()
+    if player_name is None:
+        logger.info("No current turn, draft might be complete")
+        return None, None, TURN_DURATION
+
+    draft_start = None
+    if not engine.has_picks:  # First turn of the draft
+        draft_start = get_draft_start_time()
+        if not draft_start:
+            logger.error("Could not determine draft start time")
+            return player_name, pick_number, TURN_DURATION
+    remaining_time = engine.remaining_time(draft_start)
 
-    logger.info(f"Player picks: {player_picks}")
-
-    for round_num in range(1, 4):  # Rounds 1 to 3
-        # Snake draft: reverse order in even-numbered rounds (Round 2)
-        current_order = draft_order if round_num % 2 != 0 else list(reversed(draft_order))
-        logger.info(f"Round {round_num} draft order: {current_order}")
-
-        for player in current_order:
-            player_name = player['Player'] if isinstance(player, dict) else player
-            if len(player_picks[player_name]) < round_num:
-                pick_number = round_num
-                if not picks:  # First turn of the draft
-                    draft_start = get_draft_start_time()
-                    if not draft_start:
-                        logger.error("Could not determine draft start time")
-                        return player_name, pick_number, TURN_DURATION
-                    elapsed = (datetime.now() - draft_start).total_seconds()
-                    remaining_time = max(0, TURN_DURATION - elapsed)
-                else:
-                    last_pick = max(picks, key=lambda x: x.get('Pick Time', ''), default=None)
-                    if last_pick and last_pick.get('Pick Time'):
-                        try:
-                            pick_time = datetime.strptime(last_pick['Pick Time'], '%Y-%m-%d %H:%M:%S')
-                            elapsed = (datetime.now() - pick_time).total_seconds()
-                            remaining_time = max(0, TURN_DURATION - elapsed)
-                        except ValueError as e:
-                            logger.error(f"Error parsing Pick Time '{last_pick['Pick Time']}': {str(e)}")
-                            remaining_time = TURN_DURATION
-                    else:
-                        remaining_time = TURN_DURATION
-
-                if remaining_time <= 0:
-                    logger.info(f"Timer expired for {player_name}'s turn, performing autopick")
-                    success = perform_autopick(player_name, pick_number, draft_order, picks)
-                    if success:
-                        picks = load_draft_picks()
-                        player_picks = {player['Player'] if isinstance(player, dict) else player: [] for player in draft_order}
-                        for pick in picks:
-                            player = pick['Player']
-                            if player in player_picks:
-                                player_picks[player].append(pick)
-                        return get_current_turn(picks, draft_order)
-
-                logger.info(f"Current turn - Player: {player_name}, Pick Number: {pick_number}, Remaining Time: {remaining_time}")
-                return player_name, pick_number, int(remaining_time)
-
-    logger.info("No current turn, draft might be complete")
-    return None, None, TURN_DURATION
-
-@app.route('/')
-@app.route('/index')
+    debug_sampled(logger, 20, "Current turn - Player: %s, Pick Number: %s, Remaining Time: %s", player_name, pick_number, remaining_time)
+    return player_name, pick_number, int(remaining_time)
+
+@draft_route('/')
+@draft_route('/index')
 def index():
     try:
-        if 'username' not in session:
+        draft = current_draft()
+        if session_user_key() not in session:
             logger.info("No username in session, redirecting to login")
             return redirect(url_for('login'))
 
         ensure_draft_columns()
 
-        username = session['username']
+        username = session[session_user_key()]
         logger.info(f"Loading index for username: {username}")
         # Check if draft has started
         scheduled_start = datetime(2025, 6, 8, 20, 0, 0)  # 8:00 PM EDT
@@ -352,49 +510,55 @@ def index():
             logger.info(f"Access blocked, draft starts at {scheduled_start}, current time {datetime.now()}")
             return render_template('waiting.html', start_time=scheduled_start.strftime('%I:%M %p EDT'))
 
-        golfers = load_golfers()
-        picks = load_draft_picks()
-        draft_order = get_draft_order()
-        player_picks = {player['Player'] if isinstance(player, dict) else player: [] for player in draft_order}
-
-        for pick in picks:
-            player = pick['Player']
-            if player in player_picks:
-                player_picks[player].append(pick)
+        snapshot = get_snapshot()
+        picks = snapshot.picks
+        draft_order = snapshot.draft_order
 
-        current_player, current_pick_number, remaining_time = get_current_turn(picks, draft_order)
+        current_player, current_pick_number, remaining_time = get_current_turn(picks, draft_order, snapshot.version)
         current_player = str(current_player) if current_player else 'N/A'
-        logger.info(f"Index - Current player: {current_player}, Pick number: {current_pick_number}, Remaining time: {remaining_time}")
-
-        available_golfers = [g['Golfer Name'] for g in golfers if g['Golfer Name'] not in [p['Golfer'] for p in picks]]
+        debug_sampled(logger, 20, "Index - Current player: %s, Pick number: %s, Remaining time: %s", current_player, current_pick_number, remaining_time)
+
+        # Everything but the per-user bits is rendered once per draft state version
+        fragments = draft.fragments
+        version = snapshot.version
+        player_picks = fragments.get(version, 'player_picks', lambda: group_player_picks(picks, draft_order))
+        golfer_options = fragments.get(version, 'golfer_options', lambda: Markup(
+            render_template('_golfer_options.html', golfers=get_availability(picks).available_names)))
+        participant_options = fragments.get(version, 'participant_options', lambda: Markup(
+            render_template('_participant_options.html', participants=draft_order)))
+        draft_board = fragments.get(version, 'draft_board', lambda: Markup(
+            render_template('_draft_board.html', player_picks=player_picks)))
         draft_complete = all(len(player_picks.get(player_name, [])) >= 3 for player_name in player_picks.keys())
 
         return render_template(
             'index.html',
             username=username,
-            golfers=available_golfers,
-            picks=picks,
-            participants=draft_order,
-            player_picks=player_picks,
+            golfer_options=golfer_options,
+            participant_options=participant_options,
+            draft_board=draft_board,
             draft_complete=draft_complete,
             current_player=current_player,
             current_pick_number=current_pick_number,
             timer_seconds=remaining_time,
-            user_player_mapping=user_player_mapping,
-            current_event=CURRENT_EVENT
+            pick_token=uuid.uuid4().hex,
+            pick_queue=draft.store.pick_queue(draft.user_player_mapping.get(username)),
+            user_player_mapping=draft.user_player_mapping,
+            current_event=draft.event
         )
     except Exception as e:
         logger.error(f"Internal Server Error in /index: {str(e)}")
         return "Internal Server Error", 500
 
-@app.route('/login', methods=['GET', 'POST'])
+@draft_route('/login', methods=['GET', 'POST'])
 def login():
     try:
         if request.method == 'POST':
             username = request.form['username']
             password = request.form['password']
-            if username in USER_CREDENTIALS and USER_CREDENTIALS[username] == password:
-                session['username'] = username
+            credentials = current_draft().credentials
+            if username in credentials and credentials[username] == password:
+                session.permanent = True
+                session[session_user_key()] = username
                 logger.info(f"User {username} logged in successfully")
                 return redirect(url_for('index'))
             else:
@@ -405,24 +569,24 @@ def login():
         logger.error(f"Internal Server Error in /login: {str(e)}")
         return "Internal Server Error", 500
 
-@app.route('/logout')
+@draft_route('/logout')
 def logout():
     try:
-        session.pop('username', None)
+        session.pop(session_user_key(), None)
         logger.info("User logged out")
         return redirect(url_for('login'))
     except Exception as e:
         logger.error(f"Internal Server Error in /logout: {str(e)}")
         return "Internal Server Error", 500
 
-@app.route('/pick', methods=['POST'])
+@draft_route('/pick', methods=['POST'])
 def pick():
     try:
-        if 'username' not in session:
+        if session_user_key() not in session:
             logger.info("No username in session, redirecting to login")
             return redirect(url_for('login'))
 
-        username = session['username']
+        username = session[session_user_key()]
         golfer = request.form.get('golfer')
         logger.info(f"Pick attempt - Username: {username}, Golfer: {golfer}")
         if not golfer:
@@ -430,149 +594,344 @@ def pick():
             flash('No golfer selected', 'error')
             return redirect(url_for('index'))
 
-        picks = load_draft_picks()
-        draft_order = get_draft_order()
-        current_player, current_pick_number, _ = get_current_turn(picks, draft_order)
+        user_player = current_draft().user_player_mapping.get(username)
+        token = request.form.get('pick_token')
+        if pick_already_committed(token, user_player):
+            return redirect(url_for('index'))
+
+        snapshot = get_snapshot()
+        picks = snapshot.picks
+        draft_order = snapshot.draft_order
+        current_player, current_pick_number, _ = get_current_turn(picks, draft_order, snapshot.version)
 
-        user_player = user_player_mapping.get(username)
         if user_player != current_player:
             logger.warning(f"Not {user_player}'s turn, current player is {current_player}")
             flash('Not your turn', 'error')
             return redirect(url_for('index'))
 
-        golfers = load_golfers()
-        available_golfers = [g['Golfer Name'] for g in golfers if g['Golfer Name'] not in [p['Golfer'] for p in picks]]
-        if golfer not in available_golfers:
+        if not get_availability(picks).is_available(golfer):
             logger.warning(f"Golfer {golfer} not available for {user_player}")
             flash('Golfer not available', 'error')
             return redirect(url_for('index'))
 
-        player_row = next((i + 2 for i, row in enumerate(draft_worksheet.get_all_records()) if row['Player'] == user_player), None)
-        if not player_row:
+        if not get_snapshot().has_player(user_player):
             logger.error(f"Player {user_player} not found in draft board")
             flash('Player not found in draft board', 'error')
             return redirect(url_for('index'))
 
-        column = f'Pick {current_pick_number}'
-        pick_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        pick_time_col = draft_worksheet.find('Pick Time')
-        if pick_time_col:
-            update_draft_cell(player_row, pick_time_col.col, pick_time)
-        else:
+        if 'Pick Time' not in get_snapshot().draft_headers:
             logger.error("Pick Time column not found during pick")
             flash('Pick Time column not found', 'error')
             return redirect(url_for('index'))
 
-        update_draft_cell(player_row, draft_worksheet.find(column).col, golfer)
+        commit_pick(user_player, current_pick_number, golfer, 'pick', expected_picks=len(picks), token=token)
         logger.info(f"Pick successful: {user_player} picked {golfer}")
-        # Invalidate cache after pick
-        global cached_picks, last_picks_update
-        cached_picks = None
-        last_picks_update = None
+        publish_draft_state()
 
+        return redirect(url_for('index'))
+    except PickConflict as e:
+        flash(str(e), 'error')
         return redirect(url_for('index'))
     except Exception as e:
         logger.error(f"Internal Server Error in /pick: {str(e)}")
         flash('Failed to register pick, please try again', 'error')
         return redirect(url_for('index'))
 
-@app.route('/autopick', methods=['POST'])
+@draft_route('/autopick', methods=['POST'])
 def autopick():
     try:
-        if 'username' not in session:
+        if session_user_key() not in session:
             logger.info("No username in session, redirecting to login")
             return redirect(url_for('login'))
 
-        username = session['username']
-        picks = load_draft_picks()
-        draft_order = get_draft_order()
-        current_player, current_pick_number, _ = get_current_turn(picks, draft_order)
+        username = session[session_user_key()]
+        user_player = current_draft().user_player_mapping.get(username)
+        token = request.form.get('pick_token')
+        if pick_already_committed(token, user_player):
+            return redirect(url_for('index'))
+
+        snapshot = get_snapshot()
+        picks = snapshot.picks
+        draft_order = snapshot.draft_order
+        current_player, current_pick_number, _ = get_current_turn(picks, draft_order, snapshot.version)
 
-        user_player = user_player_mapping.get(username)
         logger.info(f"Autopick - Username: {username}, User Player: {user_player}, Current Player: {current_player}")
         if user_player != current_player:
             flash('Not your turn', 'error')
             return redirect(url_for('index'))
 
-        golfers = load_golfers()
-        available_golfers = [g for g in golfers if g['Golfer Name'] not in [p['Golfer'] for p in picks]]
-        logger.info(f"Available golfers for autopick: {available_golfers}")
-        if not available_golfers:
-            flash('No golfers available', 'error')
-            return redirect(url_for('index'))
-
-        golfer = min(available_golfers, key=lambda x: int(x['Ranking']))['Golfer Name']
+        # Same choice as the turn clock's autopick: the first available queued golfer, else the best-ranked one
+        golfer = queued_pick(user_player, picks)
+        source = 'queue'
+        if golfer is None:
+            best_available = get_availability(picks).best_available()
+            if not best_available:
+                flash('No golfers available', 'error')
+                return redirect(url_for('index'))
+            golfer = best_available['Golfer Name']
+            source = 'autopick'
 
-        player_row = next((i + 2 for i, row in enumerate(draft_worksheet.get_all_records()) if row['Player'] == user_player), None)
-        if not player_row:
+        if not get_snapshot().has_player(user_player):
             flash('Player not found in draft board', 'error')
             return redirect(url_for('index'))
 
-        column = f'Pick {current_pick_number}'
-        pick_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        pick_time_col = draft_worksheet.find('Pick Time')
-        if pick_time_col:
-            update_draft_cell(player_row, pick_time_col.col, pick_time)
-        else:
+        if 'Pick Time' not in get_snapshot().draft_headers:
             flash('Pick Time column not found', 'error')
             return redirect(url_for('index'))
 
-        update_draft_cell(player_row, draft_worksheet.find(column).col, golfer)
-        logger.info(f"Autopick successful: {user_player} picked {golfer}")
-        # Invalidate cache after autopick
-        global cached_picks, last_picks_update
-        cached_picks = None
-        last_picks_update = None
+        commit_pick(user_player, current_pick_number, golfer, source, expected_picks=len(picks), token=token)
+        logger.info(f"Autopick ({source}) successful: {user_player} picked {golfer}")
+        publish_draft_state()
 
+        return redirect(url_for('index'))
+    except PickConflict as e:
+        flash(str(e), 'error')
         return redirect(url_for('index'))
     except Exception as e:
         logger.error(f"Internal Server Error in /autopick: {str(e)}")
         return "Internal Server Error", 500
 
-@app.route('/draft_state', methods=['GET'])
-def draft_state():
+def group_player_picks(picks, draft_order):
+    """Picks grouped by player, in draft order."""
+    player_picks = {player['Player'] if isinstance(player, dict) else player: [] for player in draft_order}
+    for pick in picks:
+        player = pick['Player']
+        if player in player_picks:
+            player_picks[player].append(pick)
+    return player_picks
+
+@traced('turn.snapshot')
+def get_turn_snapshot():
+    """Load picks, draft order, the current turn and the state version they belong to, all from one snapshot."""
+    draft = current_draft()
+    snapshot = get_snapshot()
+    picks = snapshot.picks
+    draft_order = snapshot.draft_order
+    turn = get_current_turn(picks, draft_order, snapshot.version)
+    # History entries are kept once written, so only record picks known to be exactly those at the version
+    if snapshot.exact and not snapshot.fallback:
+        draft.state_history.record(snapshot.version, picks)
+    return snapshot.version, picks, draft_order, turn
+
+def state_etag(version, picks):
+    return f'"{version}-{len(picks)}"'
+
+def build_turn_state(version, turn, picks, draft_order):
+    current_player, current_pick_number, remaining_time = turn
+    return {
+        'version': version,
+        'current_player': str(current_player) if current_player else 'N/A',
+        'current_pick_number': current_pick_number,
+        'remaining_time': remaining_time if remaining_time is not None else TURN_DURATION,
+        'draft_complete': current_player is None and len(picks) >= 3 * len(draft_order)
+    }
+
+@traced('state.build')
+def build_draft_state(snapshot=None):
+    """Compute the full draft state payload served by /draft_state and /draft_stream."""
+    version, picks, draft_order, turn = snapshot or get_turn_snapshot()
+
+    available_golfers = get_availability(picks).available_names
+    player_picks = group_player_picks(picks, draft_order)
+
+    state = build_turn_state(version, turn, picks, draft_order)
+    state.update({
+        'picks': picks,
+        'available_golfers': available_golfers,
+        'player_picks': player_picks,
+        'draft_complete': all(len(player_picks.get(player_name, [])) >= 3 for player_name in player_picks.keys())
+    })
+    return state
+
+def publish_draft_state():
+    """Rebuild the draft state and push it to stream subscribers if it changed."""
     try:
-        picks = load_draft_picks()
-        draft_order = get_draft_order()
-        current_player, current_pick_number, remaining_time = get_current_turn(picks, draft_order)
-        current_player = str(current_player) if current_player else 'N/A'
-
-        golfers = load_golfers()
-        available_golfers = [g['Golfer Name'] for g in golfers if g['Golfer Name'] not in [p['Golfer'] for p in picks]]
-        player_picks = {player['Player'] if isinstance(player, dict) else player: [] for player in draft_order}
-        for pick in picks:
-            player = pick['Player']
-            if player in player_picks:
-                player_picks[player].append(pick)
+        state = build_draft_state()
+        current_draft().broker.publish(state)
+        return state
+    except Exception as e:
+        logger.error(f"Error publishing draft state: {str(e)}")
+        return None
+
+def next_turn_deadline():
+    """(turn key, deadline) for the turn on the clock, or None if no turn is running."""
+    snapshot = get_snapshot()
+    picks = snapshot.picks
+    draft_order = snapshot.draft_order
+    if not draft_order:
+        return None
+    engine = get_draft_engine(picks, draft_order, snapshot.version)
+    if engine.is_complete():
+        return None
+    draft_start = None if engine.has_picks else get_draft_start_time()
+    deadline = engine.turn_deadline(draft_start)
+    if deadline is None:
+        return None
+    player, _ = engine.current_turn()
+    if queued_pick(player, picks) is not None:
+        # A queued pick is committed as soon as the turn starts instead of when its clock runs out
+        deadline -= timedelta(seconds=engine.turn_duration)
+    # Keyed by the version the picks were read at, like get_turn_snapshot() in fire_turn_deadline()
+    return (snapshot.version, engine.pick_number), deadline
+
+def fire_turn_deadline(turn_key):
+    """Autopick for the turn identified by turn_key if it is still on the clock and expired or queued.
+
+    Returns False if the autopick failed, so the turn scheduler retries it.
+    """
+    draft = current_draft()
+    with draft.autopick_lock:
+        version, picks, draft_order, turn = get_turn_snapshot()
+        current_player, current_pick_number, remaining_time = turn
+        queued = current_player is not None and queued_pick(current_player, picks) is not None
+        if (version, draft.engine.pick_number) != turn_key or current_player is None or (remaining_time > 0 and not queued):
+            logger.info(f"Turn {turn_key} already advanced, skipping autopick")
+            return True
+        if queued:
+            logger.info(f"{current_player}'s turn started, committing their queued pick")
+        else:
+            logger.info(f"Timer expired for {current_player}'s turn, performing autopick")
+        deadline = draft.engine.turn_deadline(None if draft.engine.has_picks else get_draft_start_time())
+        picked = perform_autopick(current_player, current_pick_number, draft_order, picks)
+        if picked and deadline and not queued:
+            AUTOPICK_SKEW.observe((datetime.now() - deadline).total_seconds())
+    publish_draft_state()
+    return picked
+
+def on_state_version_changed(version):
+    """Another worker committed a pick: refresh our view, push it to our stream clients and wake the timers."""
+    draft = current_draft()
+    logger.info(f"Draft {draft.draft_id} state version moved to {version}")
+    invalidate_snapshot()
+    draft.turn_scheduler.rearm()
+    if draft.sheet_sync_worker:
+        draft.store.outbox_event.set()
+    publish_draft_state()
+
+def on_queue_version_changed(version):
+    """A pick queue changed in another worker: wake the turn scheduler, which may now pick right away."""
+    current_draft().turn_scheduler.rearm()
+
+def start_background_services():
+    """Start the services that must run in exactly one process: the Sheet mirror and the turn scheduler."""
+    draft = current_draft()
+    if draft.sheet_sync_worker:
+        draft.sheet_sync_worker.start()
+    draft.turn_scheduler.start()
+
+def open_draft(config):
+    """Set up a league's store and start its background services; worksheets open on first use."""
+    if config.db_path != ':memory:':
+        os.makedirs(os.path.dirname(config.db_path) or '.', exist_ok=True)
+    draft = Draft(config)
+    draft.store, draft.sheet_sync_worker = create_store(
+        DRAFT_STORE,
+        sheets_clients.worksheet(config.spreadsheet_id, 'Golfers'),
+        sheets_clients.worksheet(config.spreadsheet_id, 'Draft Board'),
+        config.db_path,
+        sheets_limiter
+    )
+    draft.cache = SWRCache(f'draft:{config.draft_id}')
+    draft.fragments = FragmentCache()
+    draft.leaderboard = FragmentCache()
+    # Live draft state pushed to /draft_stream subscribers
+    draft.broker = DraftEventBroker()
+    draft.state_history = DraftStateHistory()
+    draft.turn_scheduler = TurnScheduler(draft.bind(next_turn_deadline), draft.bind(fire_turn_deadline))
+    if DRAFT_STORE == 'sqlite' and config.db_path != ':memory:':
+        draft.leader_election = LeaderElection(config.db_path + '.leader', draft.bind(start_background_services))
+        draft.version_watcher = VersionWatcher(draft.store.state_version, draft.bind(on_state_version_changed))
+        draft.queue_watcher = VersionWatcher(draft.store.queue_version, draft.bind(on_queue_version_changed))
+        draft.leader_election.start()
+        draft.version_watcher.start()
+        draft.queue_watcher.start()
+    else:
+        draft.bind(start_background_services)()
+    return draft
+
+drafts = DraftRegistry(
+    league_configs, open_draft,
+    max_drafts=MAX_OPEN_DRAFTS,
+    max_bytes=MAX_DRAFT_CACHE_MB * 1024 * 1024,
+    pinned=[DEFAULT_DRAFT_ID]
+)
+def prewarm():
+    """Open the default draft and load its snapshot, so its turn clock runs before anyone visits."""
+    try:
+        draft = drafts.get(DEFAULT_DRAFT_ID)
+        draft.bind(get_snapshot)()
+        logger.info("Pre-warmed the default draft")
+    except Exception as e:
+        logger.error(f"Pre-warming the default draft failed, it will open on first request: {str(e)}")
 
-        draft_complete = all(len(player_picks.get(player_name, [])) >= 3 for player_name in player_picks.keys())
+if PREWARM_DRAFTS:
+    threading.Thread(target=prewarm, name='prewarm', daemon=True).start()
 
-        return jsonify({
-            'current_player': current_player,
-            'current_pick_number': current_pick_number,
-            'remaining_time': remaining_time if remaining_time is not None else TURN_DURATION,
-            'picks': picks,
-            'available_golfers': available_golfers,
-            'player_picks': player_picks,
-            'draft_complete': draft_complete
-        })
+@draft_route('/draft_state', methods=['GET'])
+def draft_state():
+    """Full draft state; supports If-None-Match (304) and ?since=<version> (picks added since)."""
+    try:
+        draft = current_draft()
+        snapshot = get_turn_snapshot()
+        version, picks, draft_order, turn = snapshot
+        etag = state_etag(version, picks)
+        since = request.args.get('since', type=int)
+        if request.headers.get('If-None-Match') == etag or since == version:
+            return '', 304, {'ETag': etag}
+
+        if since is not None:
+            added_picks = draft.state_history.picks_since(since, picks)
+            if added_picks is not None:
+                delta = build_turn_state(version, turn, picks, draft_order)
+                delta.update({'delta': True, 'since': since, 'added_picks': added_picks})
+                return jsonify(delta), 200, {'ETag': etag}
+
+        state = build_draft_state(snapshot)
+        draft.broker.publish(state)
+        return jsonify(state), 200, {'ETag': etag}
     except Exception as e:
         logger.error(f"Internal Server Error in /draft_state: {str(e)}")
         return jsonify({
             'current_player': 'Unknown',
             'current_pick_number': None,
             'remaining_time': TURN_DURATION,
-            'picks': cached_picks if cached_picks else [],
+            'picks': getattr(current_draft().cache.peek('snapshot'), 'picks', []),
             'available_golfers': [],
             'player_picks': {},
-            'draft_complete': false,
+            'draft_complete': False,
             'error': str(e)
         }), 200
 
-@app.route('/admin_pick', methods=['POST'])
+@draft_route('/draft_stream', methods=['GET'])
+def draft_stream():
+    """Server-Sent Events stream: a 'state' event per pick or turn change, plus clock heartbeats."""
+    broker = current_draft().broker
+    if broker.last_state is None:
+        publish_draft_state()
+    subscriber = broker.subscribe()
+
+    def generate():
+        try:
+            if broker.last_state is not None:
+                yield format_sse('state', broker.last_state)
+            while True:
+                try:
+                    state = subscriber.get(timeout=HEARTBEAT_INTERVAL)
+                    yield format_sse('state', state)
+                except queue.Empty:
+                    yield format_sse('heartbeat', {'remaining_time': broker.remaining_time()})
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@draft_route('/admin_pick', methods=['POST'])
 def admin_pick():
     try:
-        if 'username' not in session or session['username'] != 'admin':
+        if session.get(session_user_key()) != 'admin':
             logger.info("Admin pick attempted by non-admin user, redirecting to login")
             return redirect(url_for('login'))
 
@@ -584,10 +943,12 @@ def admin_pick():
             flash('Please select both a player and a golfer', 'error')
             return redirect(url_for('index'))
 
+        token = request.form.get('pick_token')
+        if pick_already_committed(token, player):
+            return redirect(url_for('index'))
+
         picks = load_draft_picks()
-        golfers = load_golfers()
-        available_golfers = [g['Golfer Name'] for g in golfers if g['Golfer Name'] not in [p['Golfer'] for p in picks]]
-        if golfer not in available_golfers:
+        if not get_availability(picks).is_available(golfer):
             logger.warning(f"Golfer {golfer} not available for {player}")
             flash('Golfer not available', 'error')
             return redirect(url_for('index'))
@@ -597,8 +958,7 @@ def admin_pick():
             flash('Invalid player', 'error')
             return redirect(url_for('index'))
 
-        player_row = next((i + 2 for i, row in enumerate(draft_worksheet.get_all_records()) if row['Player'] == player), None)
-        if not player_row:
+        if not get_snapshot().has_player(player):
             logger.error(f"Player {player} not found in draft board")
             flash('Player not found in draft board', 'error')
             return redirect(url_for('index'))
@@ -610,29 +970,206 @@ def admin_pick():
             flash('Player has already made all picks', 'error')
             return redirect(url_for('index'))
 
-        column = f'Pick {current_pick_number}'
-        pick_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        pick_time_col = draft_worksheet.find('Pick Time')
-        if pick_time_col:
-            update_draft_cell(player_row, pick_time_col.col, pick_time)
-        else:
+        if 'Pick Time' not in get_snapshot().draft_headers:
             logger.error("Pick Time column not found during admin pick")
             flash('Pick Time column not found', 'error')
             return redirect(url_for('index'))
 
-        update_draft_cell(player_row, draft_worksheet.find(column).col, golfer)
+        commit_pick(player, current_pick_number, golfer, 'admin', token=token)
         logger.info(f"Admin pick successful: {player} picked {golfer}")
-        # Invalidate cache after admin pick
-        global cached_picks, last_picks_update
-        cached_picks = None
-        last_picks_update = None
+        publish_draft_state()
 
+        return redirect(url_for('index'))
+    except PickConflict as e:
+        flash(str(e), 'error')
         return redirect(url_for('index'))
     except Exception as e:
         logger.error(f"Internal Server Error in /admin_pick: {str(e)}")
         flash('Failed to register admin pick, please try again', 'error')
         return redirect(url_for('index'))
 
+@draft_route('/pick_queue', methods=['GET', 'POST'])
+def pick_queue():
+    """The logged-in player's pick queue. POST replaces it: form field 'golfers' (one per line) or a JSON list."""
+    if session_user_key() not in session:
+        return redirect(url_for('login'))
+    try:
+        draft = current_draft()
+        player = draft.user_player_mapping.get(session[session_user_key()])
+        if player is None:
+            return jsonify({'error': 'No player for this user'}), 403
+        if request.method == 'GET':
+            return jsonify({'player': player, 'queue': draft.store.pick_queue(player)})
+
+        if request.is_json:
+            golfers = request.get_json()
+        else:
+            golfers = request.form.get('golfers', '').splitlines()
+        if not isinstance(golfers, list):
+            return jsonify({'error': 'Expected a list of golfer names'}), 400
+        golfers = list(dict.fromkeys(str(golfer).strip() for golfer in golfers if str(golfer).strip()))
+        snapshot = get_snapshot()
+        picks = snapshot.picks
+        availability = get_availability(picks)
+        unknown = [golfer for golfer in golfers if golfer not in availability.names]
+        if unknown:
+            message = f"Not in the field: {', '.join(unknown)}"
+            if request.is_json:
+                return jsonify({'error': message}), 400
+            flash(message, 'error')
+            return redirect(url_for('index'))
+
+        draft.store.set_pick_queue(player, golfers)
+        logger.info(f"{player} queued {len(golfers)} golfers")
+        current_player, _, _ = get_current_turn(picks, snapshot.draft_order, snapshot.version)
+        if current_player == player:
+            # On the clock now: wake the turn scheduler to pick right away. It runs in the leader
+            # worker, so other workers signal it through the queue version; the draft state is unchanged.
+            draft.turn_scheduler.rearm()
+            if draft.queue_watcher:
+                draft.store.bump_queue_version()
+        if request.is_json:
+            return jsonify({'player': player, 'queue': golfers})
+        flash('Pick queue saved', 'success')
+        return redirect(url_for('index'))
+    except Exception as e:
+        logger.error(f"Internal Server Error in /pick_queue: {str(e)}")
+        return "Internal Server Error", 500
+
+def form_flag(value):
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+@draft_route('/admin/profiler', methods=['GET', 'POST'])
+def admin_profiler():
+    """Admin-only request profiler of this worker: GET lists the slowest traces, POST changes settings.
+
+    POST fields: enabled, sample_rate (0-1), cprofile, max_traces, clear.
+    """
+    if session.get(session_user_key()) != 'admin':
+        return jsonify({'error': 'Admin login required'}), 403
+    try:
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or request.form
+            profiler.configure(
+                enabled=form_flag(data['enabled']) if 'enabled' in data else None,
+                sample_rate=float(data['sample_rate']) if 'sample_rate' in data else None,
+                use_cprofile=form_flag(data['cprofile']) if 'cprofile' in data else None,
+                max_traces=int(data['max_traces']) if 'max_traces' in data else None
+            )
+            if form_flag(data.get('clear', False)):
+                profiler.clear()
+        return jsonify(profiler.status())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Internal Server Error in /admin/profiler: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@draft_route('/admin/profiler/<fmt>', methods=['GET'])
+def admin_profiler_download(fmt):
+    """Download kept traces (all, or ?trace=<id>) as merged cProfile 'pstats' or 'folded' flamegraph stacks."""
+    if session.get(session_user_key()) != 'admin':
+        return jsonify({'error': 'Admin login required'}), 403
+    trace_id = request.args.get('trace')
+    traces = [profiler.get(trace_id)] if trace_id else profiler.slowest()
+    if not traces or traces[0] is None:
+        return jsonify({'error': 'No such trace'}), 404
+    name = f"profile-{trace_id or 'slowest'}"
+    if fmt == 'pstats':
+        data = profiler.pstats_dump(traces)
+        if data is None:
+            return jsonify({'error': 'No cProfile data; enable cprofile and sample some requests'}), 404
+        return Response(data, mimetype='application/octet-stream',
+                        headers={'Content-Disposition': f'attachment; filename={name}.pstats'})
+    if fmt == 'folded':
+        return Response(profiler.folded(traces), mimetype='text/plain',
+                        headers={'Content-Disposition': f'attachment; filename={name}.folded'})
+    abort(404)
+
+@draft_route('/pick_history', methods=['GET'])
+def pick_history():
+    """Admin-only audit trail of every pick with its source, from the local event log."""
+    if session.get(session_user_key()) != 'admin':
+        return jsonify({'error': 'Admin login required'}), 403
+    store = current_draft().store
+    if not hasattr(store, 'pick_history'):
+        return jsonify({'error': 'Pick history needs DRAFT_STORE=sqlite'}), 404
+    try:
+        return jsonify(store.pick_history())
+    except Exception as e:
+        logger.error(f"Internal Server Error in /pick_history: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+# One score table and feed per source, shared by every league playing that event
+event_scores = {}
+event_scores_lock = threading.Lock()
+
+def get_event_scores(source):
+    with event_scores_lock:
+        scores = event_scores.get(source)
+        if scores is None:
+            scores = event_scores[source] = EventScores()
+            feed = ScoreFeed(source, scores, SCORES_POLL_INTERVAL)
+            try:
+                feed.poll()
+            except Exception as e:
+                logger.error(f"Initial score load from {source} failed: {str(e)}")
+            feed.start()
+        return scores
+
+def build_leaderboard(version, scores):
+    draft = current_draft()
+    if draft.standings is None or draft.standings[0] != version:
+        _, picks, draft_order, _ = get_turn_snapshot()
+        draft.standings = (version, TeamStandings(scores, group_player_picks(picks, draft_order)))
+    return {
+        'event': {k: v for k, v in draft.event.items() if k != 'scores'},
+        'scores_version': scores.version,
+        'standings': draft.standings[1].standings()
+    }
+
+@draft_route('/leaderboard', methods=['GET'])
+def leaderboard():
+    """Live team standings for the draft's event, cached until picks or scores change."""
+    try:
+        draft = current_draft()
+        source = draft.event.get('scores') or SCORES_SOURCE
+        if not source:
+            return jsonify({'error': 'No live scores configured for this event'}), 404
+        scores = get_event_scores(source)
+        version = draft.store.state_version()
+        payload = draft.leaderboard.get((version, scores.version), 'leaderboard', lambda: build_leaderboard(version, scores))
+        return jsonify(payload)
+    except Exception as e:
+        logger.error(f"Internal Server Error in /leaderboard: {str(e)}")
+        return jsonify({'error': 'Internal Server Error'}), 500
+
+def collect_draft_metrics():
+    """Scrape-time metrics owned by the open drafts: snapshot cache counters and stream clients."""
+    open_drafts = drafts.open_drafts()
+    cache_requests, cache_hit_ratio, fragment_requests, subscribers = [], [], [], []
+    for draft in open_drafts:
+        cache = draft.cache
+        for result, count in (('hit', cache.hits), ('stale', cache.stale_hits), ('miss', cache.misses)):
+            cache_requests.append(({'cache': cache.name, 'loader': 'snapshot', 'result': result}, count))
+        total = cache.hits + cache.stale_hits + cache.misses
+        cache_hit_ratio.append(({'cache': cache.name, 'loader': 'snapshot'}, (cache.hits + cache.stale_hits) / total if total else 0))
+        fragment_requests.append(({'draft': draft.draft_id, 'result': 'hit'}, draft.fragments.hits))
+        fragment_requests.append(({'draft': draft.draft_id, 'result': 'miss'}, draft.fragments.misses))
+        subscribers.append(({'draft': draft.draft_id}, len(draft.broker.subscribers)))
+    yield 'golfdraft_cache_requests_total', 'counter', 'Snapshot cache lookups by result.', cache_requests
+    yield 'golfdraft_cache_hit_ratio', 'gauge', 'Share of snapshot cache lookups served without waiting on the backend.', cache_hit_ratio
+    yield 'golfdraft_fragment_cache_requests_total', 'counter', 'Rendered /index fragment lookups by result.', fragment_requests
+    yield 'golfdraft_stream_subscribers', 'gauge', 'Connected /draft_stream clients.', subscribers
+    yield 'golfdraft_open_drafts', 'gauge', 'Drafts currently held in memory.', [({}, len(open_drafts))]
+
+REGISTRY.register_collector(collect_draft_metrics)
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus text-format metrics for this worker process."""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 8000))
     app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""ASGI serving mode: `gunicorn -c gunicorn.conf.py` with SERVING_MODE=asgi, or `uvicorn asgi:app`.
+
+Draft polling and streaming run on the event loop: /draft_state answers
+up-to-date clients (If-None-Match or ?since=) with a 304 from the state last
+published by the draft's broker, can hold them with ?wait=<seconds> until
+the state changes, and /draft_stream pushes broker events to an asyncio
+queue, so idle pollers and stream clients cost no thread. Every other
+request, and any poll that needs fresh data, runs the Flask app on a bounded
+thread pool with a per-request timeout; slow Sheets calls can use up at most
+that pool while pollers keep being served.
+"""
+import asyncio
+import io
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from app import (
+    CACHE_DURATION, DEFAULT_DRAFT_ID, HEARTBEAT_INTERVAL, app as flask_app, drafts, publish_draft_state, state_etag
+)
+from events import format_sse
+from metrics import REQUEST_LATENCY, REQUESTS
+
+logger = logging.getLogger(__name__)
+
+OFFLOAD_THREADS = int(os.getenv('ASGI_THREADS', 16))
+REQUEST_TIMEOUT = float(os.getenv('ASGI_REQUEST_TIMEOUT', 30))
+MAX_WAIT = 30
+
+DRAFT_PATH = re.compile(r'^(?:/drafts/(?P<draft_id>[^/]+))?/(?P<endpoint>draft_state|draft_stream)$')
+
+executor = ThreadPoolExecutor(OFFLOAD_THREADS, thread_name_prefix='asgi-offload')
+
+
+async def offload(fn, *args):
+    """Run a blocking call on the bounded pool; asyncio.TimeoutError after REQUEST_TIMEOUT.
+
+    A call that times out keeps its thread until the call itself returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(loop.run_in_executor(executor, fn, *args), REQUEST_TIMEOUT)
+
+
+def build_environ(scope, body):
+    """WSGI environ for a request whose body read_body has already buffered in full.
+
+    CONTENT_LENGTH always comes from the buffered body, so chunked uploads
+    (no Content-Length header) reach Flask's form parser intact.
+    """
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'REMOTE_ADDR': client[0],
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.input_terminated': True,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name, value = name.decode('latin-1'), value.decode('latin-1')
+        if name in ('content-length', 'transfer-encoding'):
+            # The body is already de-chunked and buffered
+            continue
+        key = 'CONTENT_TYPE' if name == 'content-type' else 'HTTP_' + name.upper().replace('-', '_')
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    environ['CONTENT_LENGTH'] = str(len(body))
+    return environ
+
+
+def run_wsgi(environ):
+    """Run one request through the Flask app; returns (status, headers, body)."""
+    response = {}
+    chunks = []
+
+    def start_response(status, headers, exc_info=None):
+        response['status'] = int(status.split(' ', 1)[0])
+        response['headers'] = headers
+        return chunks.append
+
+    result = flask_app(environ, start_response)
+    try:
+        for chunk in result:
+            chunks.append(chunk)
+    finally:
+        if hasattr(result, 'close'):
+            result.close()
+    return response['status'], response['headers'], b''.join(chunks)
+
+
+async def read_body(receive):
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            return body
+
+
+async def respond(send, status, headers=(), body=b''):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(k.encode('latin-1'), v.encode('latin-1')) for k, v in headers],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def serve_flask(scope, receive, send):
+    body = await read_body(receive)
+    try:
+        status, headers, body = await offload(run_wsgi, build_environ(scope, body))
+    except asyncio.TimeoutError:
+        logger.error(f"{scope['method']} {scope['path']} timed out after {REQUEST_TIMEOUT}s")
+        status, headers, body = 504, [('Content-Type', 'text/plain')], b'Gateway Timeout'
+    await respond(send, status, headers, body)
+
+
+def route_label(draft_id, endpoint):
+    # Same labels as the Flask routes, so both serving modes share dashboards
+    return f'/{endpoint}' if draft_id is None else f'/drafts/<draft_id>/{endpoint}'
+
+
+def published_state(draft):
+    """The broker's last published state, if recent enough to answer from."""
+    broker = draft.broker
+    if broker.last_state is None or time.monotonic() - broker.last_published > CACHE_DURATION.total_seconds():
+        return None
+    return broker.last_state
+
+
+# One in-flight republish per draft, shared by every poller that finds the published state too old
+refreshing = {}
+
+
+async def current_state(draft):
+    """The draft's published state, republished (once, off the loop) if it has gone stale."""
+    state = published_state(draft)
+    if state is not None:
+        return state
+    task = refreshing.get(draft.draft_id)
+    if task is None:
+        task = refreshing[draft.draft_id] = asyncio.ensure_future(offload(draft.bind(publish_draft_state)))
+        task.add_done_callback(lambda _: refreshing.pop(draft.draft_id, None))
+    try:
+        await asyncio.shield(task)
+    except asyncio.TimeoutError:
+        return None
+    return published_state(draft)
+
+
+async def wait_for_change(draft, state, timeout):
+    subscriber = draft.broker.subscribe_async(asyncio.get_running_loop())
+    try:
+        if draft.broker.last_state is not state:
+            # Published between our check and subscribing
+            return True
+        await asyncio.wait_for(subscriber.get(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        draft.broker.unsubscribe(subscriber)
+
+
+async def draft_state(draft, route, scope, receive, send):
+    """Answer up-to-date pollers on the loop; anything else goes to the Flask view."""
+    started = time.perf_counter()
+    args = parse_qs(scope['query_string'].decode('latin-1'))
+    headers = {k.decode('latin-1'): v.decode('latin-1') for k, v in scope['headers']}
+    try:
+        since = int(args['since'][0]) if 'since' in args else None
+        wait = min(max(float(args.get('wait', ['0'])[0]), 0), MAX_WAIT)
+    except ValueError:
+        since, wait = None, 0
+    state = await current_state(draft)
+    if state is not None:
+        etag = state_etag(state['version'], state['picks'])
+        if headers.get('if-none-match') == etag or since == state['version']:
+            if not wait or not await wait_for_change(draft, state, wait):
+                await respond(send, 304, [('ETag', etag)])
+                REQUEST_LATENCY.observe(time.perf_counter() - started, route=route, method='GET')
+                REQUESTS.inc(route=route, method='GET', status=304)
+                return
+    await serve_flask(scope, receive, send)
+
+
+async def draft_stream(draft, route, scope, receive, send):
+    """Server-Sent Events from the draft's broker, with clock heartbeats, without a thread per client."""
+    broker = draft.broker
+    if broker.last_state is None:
+        try:
+            await offload(draft.bind(publish_draft_state))
+        except asyncio.TimeoutError:
+            # Open the stream anyway; the first publish or heartbeat follows
+            logger.warning(f"Initial draft state for {draft.draft_id} stream timed out after {REQUEST_TIMEOUT}s")
+    subscriber = broker.subscribe_async(asyncio.get_running_loop())
+    disconnected = asyncio.Event()
+
+    async def watch_disconnect():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        disconnected.set()
+
+    watcher = asyncio.create_task(watch_disconnect())
+    REQUESTS.inc(route=route, method='GET', status=200)
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream; charset=utf-8'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        if broker.last_state is not None:
+            initial = format_sse('state', broker.last_state).encode()
+        else:
+            # An SSE comment: flushes the headers so the client sees the stream open
+            initial = b': keepalive\n\n'
+        await send({'type': 'http.response.body', 'body': initial, 'more_body': True})
+        while not disconnected.is_set():
+            try:
+                event = format_sse('state', await asyncio.wait_for(subscriber.get(), HEARTBEAT_INTERVAL))
+            except asyncio.TimeoutError:
+                event = format_sse('heartbeat', {'remaining_time': broker.remaining_time()})
+            await send({'type': 'http.response.body', 'body': event.encode(), 'more_body': True})
+    except OSError:
+        # Client went away mid-send
+        pass
+    finally:
+        watcher.cancel()
+        broker.unsubscribe(subscriber)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        return
+    match = DRAFT_PATH.match(scope['path'])
+    if match and scope['method'] == 'GET':
+        draft_id = match['draft_id'] or DEFAULT_DRAFT_ID
+        draft = drafts.peek(draft_id, use=True)
+        if draft is None and draft_id in drafts:
+            # Opening a draft touches the store and Sheets: do it off the loop, then take our use on the loop
+            # (a use taken in the offloaded call would leak if the call timed out)
+            try:
+                await offload(drafts.get, draft_id)
+            except asyncio.TimeoutError:
+                logger.error(f"Opening draft {draft_id} timed out after {REQUEST_TIMEOUT}s")
+                return await respond(send, 504, [('Content-Type', 'text/plain')], b'Gateway Timeout')
+            draft = drafts.peek(draft_id, use=True)
+        if draft is not None:
+            route = route_label(match['draft_id'], match['endpoint'])
+            handler = draft_state if match['endpoint'] == 'draft_state' else draft_stream
+            try:
+                return await handler(draft, route, scope, receive, send)
+            finally:
+                drafts.release(draft)
+    await serve_flask(scope, receive, send)
@@ -0,0 +1,70 @@
+import heapq
+import threading
+
+
+class AvailabilityIndex:
+    """Which golfers are still undrafted, kept up to date pick by pick.
+
+    Drafted names live in a set for O(1) checks, undrafted golfers in a heap
+    of their positions in the ranking-sorted field so the best available
+    comes back in O(log n), and the ranking-ordered list of available names
+    is built once per change rather than on every request.
+    """
+
+    def __init__(self, golfers):
+        self.golfers = golfers
+        self.names = {g['Golfer Name'] for g in golfers}
+        self.lock = threading.Lock()
+        self.drafted = set()
+        self.synced_picks = None
+        self._build_heap()
+
+    def _build_heap(self):
+        self.heap = [
+            (i, g['Golfer Name'])
+            for i, g in enumerate(self.golfers) if g['Golfer Name'] not in self.drafted
+        ]
+        heapq.heapify(self.heap)
+        self._available_names = None
+
+    def sync(self, picks):
+        """Bring the drafted set in line with a freshly loaded picks list."""
+        with self.lock:
+            if picks is self.synced_picks:
+                return
+            drafted = {p['Golfer'] for p in picks}
+            if drafted != self.drafted:
+                undrafted = not drafted >= self.drafted
+                self.drafted = drafted
+                if undrafted:
+                    # A pick was removed at the source; popped heap entries have to come back
+                    self._build_heap()
+                else:
+                    self._available_names = None
+            self.synced_picks = picks
+
+    def draft(self, name):
+        """Record a pick committed by this process."""
+        with self.lock:
+            if name not in self.drafted:
+                self.drafted.add(name)
+                self._available_names = None
+
+    def is_available(self, name):
+        return name in self.names and name not in self.drafted
+
+    def best_available(self):
+        """Best-ranked undrafted golfer record, or None if the field is exhausted."""
+        with self.lock:
+            while self.heap and self.heap[0][1] in self.drafted:
+                heapq.heappop(self.heap)
+            return self.golfers[self.heap[0][0]] if self.heap else None
+
+    @property
+    def available_names(self):
+        """Undrafted golfer names in ranking order; rebuilt only after a pick."""
+        names = self._available_names
+        if names is None:
+            with self.lock:
+                names = self._available_names = [g['Golfer Name'] for g in self.golfers if g['Golfer Name'] not in self.drafted]
+        return names
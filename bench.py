@@ -0,0 +1,217 @@
+"""Load test: simulated clients run a full snake draft against the app on a fake Sheets backend.
+
+Every player logs in and polls /draft_state, picking (or autopicking) when it
+is their turn; spectators poll /draft_state?since=<version> like the browser
+does and reload /index now and then. Sheets calls go to FakeSheetsBackend, so
+latency, quotas and 429s are under our control and no Google account is used.
+
+    python bench.py --spectators 12 --latency 0.15 --read-quota 60
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import gspread
+
+import sheets_client
+from fake_sheets import FakeClient, FakeSheetsBackend, draft_worksheets
+
+BENCH_SPREADSHEET_ID = 'bench'
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, endpoint, seconds, status):
+        with self.lock:
+            self.latencies[endpoint].append(seconds)
+            if status >= 500:
+                self.errors[endpoint] += 1
+
+    @property
+    def total_requests(self):
+        return sum(len(samples) for samples in self.latencies.values())
+
+
+class SimulatedClient:
+    """One browser session driving the app through Flask's test client."""
+
+    def __init__(self, app, recorder, username, password):
+        self.client = app.test_client()
+        self.recorder = recorder
+        self.username = username
+        self.password = password
+        self.version = None
+
+    def request(self, endpoint, method, path, **kwargs):
+        started = time.perf_counter()
+        response = self.client.open(path, method=method, **kwargs)
+        self.recorder.record(endpoint, time.perf_counter() - started, response.status_code)
+        return response
+
+    def login(self):
+        self.request('/login', 'POST', '/login', data={'username': self.username, 'password': self.password})
+        self.request('/index', 'GET', '/index')
+
+    def full_state(self):
+        response = self.request('/draft_state', 'GET', '/draft_state')
+        state = response.get_json()
+        self.version = state.get('version', self.version)
+        return state
+
+    def poll_state(self):
+        """Poll like the page does: only what changed since the last version seen."""
+        path = '/draft_state' if self.version is None else f'/draft_state?since={self.version}'
+        response = self.request('/draft_state?since', 'GET', path)
+        if response.status_code == 304:
+            return None
+        state = response.get_json()
+        self.version = state.get('version', self.version)
+        return state
+
+
+def run_player(app, recorder, username, password, player, args, done):
+    client = SimulatedClient(app, recorder, username, password)
+    client.login()
+    while not done.is_set():
+        state = client.full_state()
+        if state.get('draft_complete'):
+            done.set()
+            break
+        if state.get('current_player') == player:
+            if random.random() < args.autopick_ratio:
+                client.request('/autopick', 'POST', '/autopick')
+            else:
+                golfers = state.get('available_golfers') or []
+                if golfers:
+                    golfer = random.choice(golfers[:args.pick_from_top])
+                    client.request('/pick', 'POST', '/pick', data={'golfer': golfer})
+            continue
+        time.sleep(args.poll_interval)
+
+
+def run_spectator(app, recorder, username, password, args, done):
+    client = SimulatedClient(app, recorder, username, password)
+    client.login()
+    polls = 0
+    while not done.is_set():
+        client.poll_state()
+        polls += 1
+        if polls % args.reload_every == 0:
+            client.request('/index', 'GET', '/index')
+        time.sleep(args.poll_interval)
+
+
+def load_app(backend, args):
+    """Import the app with gspread pointed at the fake backend."""
+    workdir = tempfile.mkdtemp(prefix='golf-draft-bench-')
+    os.environ.update({
+        'SERVICE_ACCOUNT_JSON': '{}',
+        'SPREADSHEET_ID': BENCH_SPREADSHEET_ID,
+        'DRAFT_STORE': args.store,
+        'DRAFT_DB_PATH': os.path.join(workdir, 'draft.db'),
+        'LEAGUES_FILE': '',
+        'PREWARM_DRAFTS': 'false'
+    })
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(workdir)  # Session files and leader locks stay out of the checkout
+
+    def build_worksheets(key):
+        # Called when the bench opens the draft, after app.py has been imported
+        players = list(sys.modules['app'].user_player_mapping.values())
+        return draft_worksheets(players, args.field_size)
+
+    client = FakeClient(backend, build_worksheets)
+    sheets_client.Credentials.from_service_account_info = staticmethod(lambda info, scopes=None: None)
+    gspread.authorize = lambda credentials: client
+
+    import app
+    logging.getLogger().setLevel(args.log_level)
+    return app
+
+
+def report(recorder, backend, elapsed, picks, outbox_left):
+    print(f"\n{'endpoint':<20}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for endpoint, samples in sorted(recorder.latencies.items()):
+        print(f"{endpoint:<20}{len(samples):>10}{recorder.errors[endpoint]:>8}"
+              f"{percentile(samples, 50) * 1000:>10.1f}{percentile(samples, 99) * 1000:>10.1f}")
+    total = recorder.total_requests
+    print(f"\n{picks} picks in {elapsed:.1f}s, {total} requests, {total / elapsed:.1f} req/s")
+    print(f"Backend calls: {backend.total_calls} ({backend.total_calls / max(total, 1):.3f} per request), "
+          f"throttled: {sum(backend.throttled.values())}, unsynced writes: {outbox_left}")
+    for name, count in sorted(backend.calls.items()):
+        print(f"  {name:<20}{count:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--store', choices=['sqlite', 'sheets'], default='sqlite')
+    parser.add_argument('--spectators', type=int, default=12, help='Clients that only watch the draft')
+    parser.add_argument('--poll-interval', type=float, default=0.5, help='Seconds between polls per client')
+    parser.add_argument('--reload-every', type=int, default=20, help='Spectator polls between /index reloads')
+    parser.add_argument('--autopick-ratio', type=float, default=0.2)
+    parser.add_argument('--pick-from-top', type=int, default=5, help='Players pick among the N best available')
+    parser.add_argument('--field-size', type=int, default=156)
+    parser.add_argument('--latency', type=float, default=0.1, help='Fake Sheets call latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.05)
+    parser.add_argument('--read-quota', type=int, default=None, help='Sheets reads allowed per minute')
+    parser.add_argument('--write-quota', type=int, default=None, help='Sheets writes allowed per minute')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of Sheets calls failing with 429')
+    parser.add_argument('--max-seconds', type=float, default=300)
+    parser.add_argument('--log-level', default='WARNING')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    backend = FakeSheetsBackend(args.latency, args.jitter, args.read_quota, args.write_quota, args.error_rate)
+    app = load_app(backend, args)
+    draft = app.drafts.get(app.DEFAULT_DRAFT_ID)
+
+    recorder = Recorder()
+    done = threading.Event()
+    threads = [
+        threading.Thread(target=run_player, args=(app.app, recorder, username, app.USER_CREDENTIALS[username], player, args, done), daemon=True)
+        for username, player in app.user_player_mapping.items()
+    ]
+    spectator_names = list(app.user_player_mapping)
+    threads += [
+        threading.Thread(target=run_spectator, args=(app.app, recorder, name, app.USER_CREDENTIALS[name], args, done), daemon=True)
+        for name in (spectator_names[i % len(spectator_names)] for i in range(args.spectators))
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    if not done.wait(args.max_seconds):
+        print(f"Draft did not finish within {args.max_seconds}s", file=sys.stderr)
+        done.set()
+    elapsed = time.perf_counter() - started
+    for thread in threads:
+        thread.join(timeout=10)
+
+    outbox_left = 0
+    if draft.sheet_sync_worker:
+        deadline = time.monotonic() + 30
+        while draft.store.outbox_size() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        outbox_left = draft.store.outbox_size()
+    picks = draft.engine.pick_number - 1 if draft.engine else 0
+    report(recorder, backend, elapsed, picks, outbox_left)
+
+
+if __name__ == '__main__':
+    main()
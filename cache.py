@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshBackoff(Exception):
+    """A recent load of this key failed and the cache is waiting before the next one; caused by that failure."""
+
+
+class _Entry:
+    def __init__(self):
+        self.value = None
+        self.has_value = False
+        self.expires_at = 0
+        self.invalidated = False
+        # Bumped by invalidate() so a fetch that started earlier cannot overwrite newer state
+        self.generation = 0
+        self.inflight = None
+        # Consecutive failed loads, for backing off while the backend is down or over budget
+        self.failures = 0
+        self.retry_at = 0
+        self.error = None
+
+
+class _Flight:
+    def __init__(self, generation):
+        self.generation = generation
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SWRCache:
+    """Thread-safe stale-while-revalidate cache with per-key TTLs.
+
+    - A fresh value is returned immediately.
+    - A stale value is returned immediately while one background refresh runs.
+    - A missing or invalidated value is loaded once; concurrent callers wait on
+      that single in-flight fetch instead of each calling the backend.
+    - After a failed load no new fetch starts until an exponential backoff
+      (retry_after doubling up to max_retry_after) has passed: a stale value
+      keeps being served, and an invalidated one raises RefreshBackoff.
+    """
+
+    def __init__(self, name='cache', retry_after=1, max_retry_after=10):
+        self.name = name
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, key, loader, ttl):
+        """Return the value for key, using loader() to (re)fetch it; ttl is in seconds."""
+        with self.lock:
+            entry = self.entries.setdefault(key, _Entry())
+            now = time.monotonic()
+            if entry.has_value and not entry.invalidated:
+                if now < entry.expires_at:
+                    self.hits += 1
+                    return entry.value
+                self.stale_hits += 1
+                if entry.inflight is None and now >= entry.retry_at:
+                    entry.inflight = _Flight(entry.generation)
+                    threading.Thread(
+                        target=self._load, args=(key, entry, entry.inflight, loader, ttl),
+                        name=f'{self.name}-refresh-{key}', daemon=True
+                    ).start()
+                return entry.value
+            self.misses += 1
+            if entry.has_value and entry.error is not None and now < entry.retry_at and entry.inflight is None:
+                # Backing off: let the caller fall back to peek() without another backend call
+                raise RefreshBackoff(f"{self.name}[{key}] failed {entry.failures} times, retrying in {entry.retry_at - now:.1f}s") from entry.error
+            flight = entry.inflight
+            leader = flight is None or flight.generation != entry.generation
+            if leader:
+                flight = entry.inflight = _Flight(entry.generation)
+
+        if leader:
+            self._load(key, entry, flight, loader, ttl)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _load(self, key, entry, flight, loader, ttl):
+        try:
+            flight.value = loader()
+        except Exception as e:
+            flight.error = e
+        with self.lock:
+            failures = entry.failures
+            if flight.error is None:
+                entry.failures = 0
+                entry.retry_at = 0
+                entry.error = None
+                if flight.generation == entry.generation:
+                    entry.value = flight.value
+                    entry.has_value = True
+                    entry.invalidated = False
+                    entry.expires_at = time.monotonic() + ttl
+            else:
+                entry.failures += 1
+                entry.retry_at = time.monotonic() + min(self.retry_after * 2 ** failures, self.max_retry_after)
+                entry.error = flight.error
+            has_value = entry.has_value
+            if entry.inflight is flight:
+                entry.inflight = None
+        flight.done.set()
+        # One line per outage, not one per attempt
+        if flight.error is None and failures:
+            logger.info(f"Refresh of {self.name}[{key}] recovered after {failures} failed attempts")
+        elif flight.error is not None and has_value:
+            log = logger.warning if not failures else logger.debug
+            log(f"Refresh of {self.name}[{key}] failed, keeping stale value and backing off: {str(flight.error)}")
+
+    def peek(self, key):
+        """Last loaded value for key, even if stale or invalidated, or None."""
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry.value if entry and entry.has_value else None
+
+    def invalidate(self, key=None):
+        """Force the next get() of key (or of every key) to fetch a fresh value."""
+        with self.lock:
+            if key is None:
+                entries = list(self.entries.values())
+            else:
+                entries = [self.entries[key]] if key in self.entries else []
+            for entry in entries:
+                entry.invalidated = True
+                entry.generation += 1
+
+
+class FragmentCache:
+    """Rendered page fragments for one state version; moving to a new version drops the old ones.
+
+    A burst of page loads at the same version renders each fragment once.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.fragments = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version, name, render):
+        with self.lock:
+            if version != self.version:
+                self.version = version
+                self.fragments = {}
+            if name in self.fragments:
+                self.hits += 1
+                return self.fragments[name]
+            self.misses += 1
+        fragment = render()
+        with self.lock:
+            if version == self.version:
+                self.fragments[name] = fragment
+        return fragment
@@ -0,0 +1,132 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+PICK_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def parse_pick_time(value):
+    try:
+        return datetime.strptime(value, PICK_TIME_FORMAT) if value else None
+    except ValueError as e:
+        logger.error(f"Error parsing Pick Time '{value}': {str(e)}")
+        return None
+
+
+class DraftEngine:
+    """Snake-draft turn engine.
+
+    The full (player, round) schedule is built once from the draft order and a
+    cursor walks it as picks are committed, so the current turn and its clock
+    are answered without rescanning picks or re-parsing pick times.
+
+    One engine is shared by every request thread: counts and cursor are built
+    aside and swapped in under the lock, reads take the lock, and the engine
+    never moves back to a state version older than the one it has.
+    """
+
+    def __init__(self, draft_order, rounds=3, turn_duration=180):
+        self.players = tuple(p['Player'] if isinstance(p, dict) else p for p in draft_order)
+        self.rounds = rounds
+        self.turn_duration = turn_duration
+        # Snake draft: reverse order in even-numbered rounds
+        self.schedule = [
+            (player, round_num)
+            for round_num in range(1, rounds + 1)
+            for player in (self.players if round_num % 2 != 0 else tuple(reversed(self.players)))
+        ]
+        self.lock = threading.Lock()
+        self.synced_picks = None
+        self.synced_version = -1
+        self.pick_counts = {player: 0 for player in self.players}
+        self.cursor = 0
+        self.last_pick_time = None
+        self.has_picks = False
+
+    def matches(self, draft_order):
+        return self.players == tuple(p['Player'] if isinstance(p, dict) else p for p in draft_order)
+
+    def _advance(self, pick_counts, cursor):
+        while cursor < len(self.schedule):
+            player, round_num = self.schedule[cursor]
+            if pick_counts[player] < round_num:
+                break
+            cursor += 1
+        return cursor
+
+    def sync(self, picks, version):
+        """Rebuild counts, cursor and last pick time from the picks list of the snapshot at the given state version.
+
+        A list from an older version (e.g. held by a request that started before a pick) is ignored.
+        """
+        with self.lock:
+            if picks is self.synced_picks or version < self.synced_version:
+                return
+        pick_counts = {player: 0 for player in self.players}
+        last_pick_time = None
+        for pick in picks:
+            if pick['Player'] in pick_counts:
+                pick_counts[pick['Player']] += 1
+            pick_time = parse_pick_time(pick.get('Pick Time'))
+            if pick_time and (last_pick_time is None or pick_time > last_pick_time):
+                last_pick_time = pick_time
+        cursor = self._advance(pick_counts, 0)
+        with self.lock:
+            if version < self.synced_version:
+                # A newer snapshot or commit landed while we counted
+                return
+            self.pick_counts, self.cursor = pick_counts, cursor
+            self.last_pick_time, self.has_picks = last_pick_time, bool(picks)
+            self.synced_picks, self.synced_version = picks, version
+
+    def commit(self, player, pick_time, version):
+        """Advance the cursor for a pick this process committed at the given state version."""
+        if isinstance(pick_time, str):
+            pick_time = parse_pick_time(pick_time)
+        with self.lock:
+            if version <= self.synced_version:
+                # Already counted by a sync to a snapshot that includes this pick
+                return
+            pick_counts = dict(self.pick_counts)
+            if player in pick_counts:
+                pick_counts[player] += 1
+            self.pick_counts = pick_counts
+            self.cursor = self._advance(pick_counts, self.cursor)
+            self.has_picks = True
+            if pick_time and (self.last_pick_time is None or pick_time > self.last_pick_time):
+                self.last_pick_time = pick_time
+            self.synced_version = version
+
+    def current_turn(self):
+        """Return (player, round) on the clock, or (None, None) once the draft is complete."""
+        with self.lock:
+            if self.cursor >= len(self.schedule):
+                return None, None
+            return self.schedule[self.cursor]
+
+    @property
+    def pick_number(self):
+        """Overall 1-based pick number on the clock."""
+        with self.lock:
+            return self.cursor + 1
+
+    def is_complete(self):
+        with self.lock:
+            return self.cursor >= len(self.schedule)
+
+    def turn_deadline(self, draft_start=None):
+        """When the current turn's clock runs out; the first turn runs from the draft start time."""
+        with self.lock:
+            turn_started = self.last_pick_time if self.has_picks else draft_start
+            if turn_started is None or self.cursor >= len(self.schedule):
+                return None
+        return turn_started + timedelta(seconds=self.turn_duration)
+
+    def remaining_time(self, draft_start=None, now=None):
+        """Seconds left on the current turn."""
+        deadline = self.turn_deadline(draft_start)
+        if deadline is None:
+            return self.turn_duration
+        return max(0, (deadline - (now or datetime.now())).total_seconds())
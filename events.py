@@ -0,0 +1,159 @@
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSubscriber:
+    """Subscriber queue read from an asyncio event loop; publishes from other threads hop onto that loop."""
+
+    def __init__(self, loop, maxsize):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize)
+
+    def put_nowait(self, state):
+        try:
+            self.loop.call_soon_threadsafe(self._put, state)
+        except RuntimeError:
+            # The loop has shut down; the broker drops us on unsubscribe
+            pass
+
+    def _put(self, state):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(state)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class DraftEventBroker:
+    """Fan out draft state changes to Server-Sent Events subscribers.
+
+    Each subscriber gets a small bounded queue; slow clients drop their oldest
+    pending event rather than holding up a publish.
+    """
+
+    def __init__(self, queue_size=16):
+        self.queue_size = queue_size
+        self.lock = threading.Lock()
+        self.subscribers = set()
+        self.last_state = None
+        self.last_published = None
+
+    def subscribe(self):
+        q = queue.Queue(maxsize=self.queue_size)
+        with self.lock:
+            self.subscribers.add(q)
+        logger.info(f"Draft stream subscriber added, {len(self.subscribers)} connected")
+        return q
+
+    def subscribe_async(self, loop):
+        """Subscribe from a coroutine running on loop; read states with await subscriber.get()."""
+        subscriber = AsyncSubscriber(loop, self.queue_size)
+        with self.lock:
+            self.subscribers.add(subscriber)
+        logger.info(f"Draft stream subscriber added, {len(self.subscribers)} connected")
+        return subscriber
+
+    def unsubscribe(self, q):
+        with self.lock:
+            self.subscribers.discard(q)
+        logger.info(f"Draft stream subscriber removed, {len(self.subscribers)} connected")
+
+    @staticmethod
+    def _state_key(state):
+        # The clock is carried by heartbeats, so it does not count as a change
+        return {k: v for k, v in state.items() if k != 'remaining_time'}
+
+    def publish(self, state):
+        """Push state to every subscriber, returning True if it differs from the last published state."""
+        with self.lock:
+            changed = self.last_state is None or self._state_key(state) != self._state_key(self.last_state)
+            self.last_state = state
+            self.last_published = time.monotonic()
+            if not changed:
+                return False
+            subscribers = list(self.subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait(state)
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+                q.put_nowait(state)
+        logger.info(f"Published draft state to {len(subscribers)} subscribers")
+        return True
+
+    def remaining_time(self):
+        """Seconds left on the current turn, extrapolated from the last published state."""
+        with self.lock:
+            if self.last_state is None:
+                return None
+            elapsed = time.monotonic() - self.last_published
+            return max(0, int(self.last_state['remaining_time'] - elapsed))
+
+
+def format_sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class DraftStateHistory:
+    """Remember which picks existed at recent state versions so clients can fetch deltas."""
+
+    def __init__(self, size=64):
+        self.size = size
+        self.lock = threading.Lock()
+        self.versions = OrderedDict()
+
+    @staticmethod
+    def pick_key(pick):
+        return (pick['Player'], pick['Pick Number'])
+
+    def record(self, version, picks):
+        with self.lock:
+            if version in self.versions:
+                return
+            self.versions[version] = frozenset(self.pick_key(p) for p in picks)
+            while len(self.versions) > self.size:
+                self.versions.popitem(last=False)
+
+    def picks_since(self, version, picks):
+        """Picks added after the given version, or None if that version is no longer remembered."""
+        with self.lock:
+            known = self.versions.get(version)
+        if known is None:
+            return None
+        return [p for p in picks if self.pick_key(p) not in known]
+
+
+class VersionWatcher(threading.Thread):
+    """Poll a cheap version counter and call on_change when another worker moves it."""
+
+    def __init__(self, get_version, on_change, interval=0.5):
+        super().__init__(name='version-watcher', daemon=True)
+        self.get_version = get_version
+        self.on_change = on_change
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def stop(self):
+        self.stopped.set()
+
+    def run(self):
+        last_version = None
+        while not self.stopped.wait(self.interval):
+            try:
+                version = self.get_version()
+                if last_version is not None and version != last_version:
+                    self.on_change(version)
+                last_version = version
+            except Exception as e:
+                logger.error(f"Version watcher failed: {str(e)}")
@@ -0,0 +1,155 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+
+import requests
+from gspread.exceptions import APIError, WorksheetNotFound
+
+READ_CALLS = {'values_batch_get', 'get_all_values', 'get_all_records', 'row_values'}
+
+
+def a1_to_rowcol(label):
+    match = re.match(r'([A-Z]+)(\d+)$', label.split('!')[-1])
+    col = 0
+    for ch in match.group(1):
+        col = col * 26 + ord(ch) - 64
+    return int(match.group(2)), col
+
+
+def quota_error(message='Quota exceeded for quota metric'):
+    response = requests.Response()
+    response.status_code = 429
+    response._content = json.dumps({'error': {'code': 429, 'message': message, 'status': 'RESOURCE_EXHAUSTED'}}).encode()
+    return APIError(response)
+
+
+class FakeSheetsBackend:
+    """In-process stand-in for the Sheets API used by the draft store.
+
+    Every call sleeps for latency +/- jitter seconds and is counted; reads and
+    writes each have a per-minute quota, and calls over quota (or picked at
+    random with error_rate) fail with a 429 APIError, as gspread raises them.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, read_quota=None, write_quota=None, error_rate=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.quotas = {'read': read_quota, 'write': write_quota}
+        self.error_rate = error_rate
+        self.lock = threading.Lock()
+        self.windows = {'read': deque(), 'write': deque()}
+        self.calls = Counter()
+        self.throttled = Counter()
+
+    def call(self, name):
+        kind = 'read' if name in READ_CALLS else 'write'
+        with self.lock:
+            self.calls[name] += 1
+            now = time.monotonic()
+            window = self.windows[kind]
+            while window and window[0] <= now - 60:
+                window.popleft()
+            over_quota = self.quotas[kind] is not None and len(window) >= self.quotas[kind]
+            if over_quota or random.random() < self.error_rate:
+                self.throttled[name] += 1
+                raise quota_error()
+            window.append(now)
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, rows):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows = [list(row) for row in rows]
+
+    def _values(self):
+        return [list(row) for row in self.rows]
+
+    def _set(self, row, col, value):
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        while len(cells) < col:
+            cells.append('')
+        cells[col - 1] = value
+
+    def get_all_values(self):
+        self.spreadsheet.backend.call('get_all_values')
+        with self.spreadsheet.lock:
+            return self._values()
+
+    def get_all_records(self):
+        self.spreadsheet.backend.call('get_all_records')
+        with self.spreadsheet.lock:
+            headers = self.rows[0] if self.rows else []
+            return [dict(zip(headers, row + [''] * (len(headers) - len(row)))) for row in self.rows[1:]]
+
+    def row_values(self, row):
+        self.spreadsheet.backend.call('row_values')
+        with self.spreadsheet.lock:
+            return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def update_cell(self, row, col, value):
+        self.spreadsheet.backend.call('update_cell')
+        with self.spreadsheet.lock:
+            self._set(row, col, value)
+
+    def batch_update(self, data, raw=True):
+        self.spreadsheet.backend.call('batch_update')
+        with self.spreadsheet.lock:
+            for update in data:
+                row, col = a1_to_rowcol(update['range'])
+                self._set(row, col, update['values'][0][0])
+
+
+class FakeSpreadsheet:
+    def __init__(self, backend, worksheets):
+        self.backend = backend
+        self.lock = threading.Lock()
+        self.worksheets = {title: FakeWorksheet(self, title, rows) for title, rows in worksheets.items()}
+
+    def worksheet(self, title):
+        try:
+            return self.worksheets[title]
+        except KeyError:
+            raise WorksheetNotFound(title)
+
+    def values_batch_get(self, ranges):
+        self.backend.call('values_batch_get')
+        with self.lock:
+            return {'valueRanges': [
+                {'range': r, 'values': self.worksheets[r.strip("'")]._values()} for r in ranges
+            ]}
+
+
+class FakeClient:
+    """Replacement for the object gspread.authorize() returns; spreadsheets are built on first open."""
+
+    def __init__(self, backend, build_worksheets):
+        self.backend = backend
+        self.build_worksheets = build_worksheets
+        self.spreadsheets = {}
+
+    def open_by_key(self, key):
+        if key not in self.spreadsheets:
+            self.spreadsheets[key] = FakeSpreadsheet(self.backend, self.build_worksheets(key))
+        return self.spreadsheets[key]
+
+
+def draft_worksheets(players, field_size=156):
+    """Golfers and Draft Board values for a fresh draft between the given players."""
+    golfers = [['Golfer Name', 'Ranking']] + [[f'Golfer {i:03d}', str(i)] for i in range(1, field_size + 1)]
+    board = [['Player', 'Draft Order', 'Pick 1', 'Pick 2', 'Pick 3']] + [
+        [player, str(i), '', '', ''] for i, player in enumerate(players, start=1)
+    ]
+    return {'Golfers': golfers, 'Draft Board': board}
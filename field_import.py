@@ -0,0 +1,134 @@
+"""Bulk import of the golfer field into the local draft store, optionally pushed to the Sheet.
+
+Streams a CSV or JSON-lines file (one golfer per line with a name, world
+ranking and optional odds), validating each row as it is read; the store
+sorts the field by ranking once and assigns integer IDs, so no request ever
+parses or sorts rankings. An invalid row aborts the import and leaves the
+current field untouched.
+
+    python field_import.py field.csv --db draft.db --push
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import re
+import sys
+
+from store import LocalDraftStore, SheetsDraftStore
+
+logger = logging.getLogger(__name__)
+
+NAME_KEYS = ('golfer name', 'golfer', 'name')
+RANKING_KEYS = ('ranking', 'world ranking', 'world_ranking', 'owgr', 'rank')
+ODDS_KEYS = ('odds',)
+ODDS_PATTERN = re.compile(r'^([+-]\d+|\d+(\.\d+)?|\d+/\d+)$')
+
+
+class FieldImportError(ValueError):
+    """A field file row that cannot be imported."""
+
+    def __init__(self, line, message):
+        super().__init__(f"Line {line}: {message}")
+        self.line = line
+
+
+def iter_field_file(path):
+    """(line number, raw row dict) for each golfer in a CSV or JSON-lines file, read lazily."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line, text in enumerate(f, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    row = json.loads(text)
+                except json.JSONDecodeError as e:
+                    raise FieldImportError(line, f"invalid JSON: {str(e)}")
+                if not isinstance(row, dict):
+                    raise FieldImportError(line, "expected a JSON object")
+                yield line, row
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+
+def _field(row, keys):
+    for key, value in row.items():
+        if key is not None and key.strip().lower() in keys and value not in (None, ''):
+            return value
+    return None
+
+
+def validate_row(line, row):
+    """(name, ranking, odds) for one raw row, or FieldImportError."""
+    name = _field(row, NAME_KEYS)
+    if name is None or not str(name).strip():
+        raise FieldImportError(line, "missing golfer name")
+    name = ' '.join(str(name).split())
+    ranking = _field(row, RANKING_KEYS)
+    try:
+        ranking = int(float(str(ranking).strip()))
+    except (TypeError, ValueError):
+        raise FieldImportError(line, f"invalid ranking {ranking!r} for {name}")
+    if ranking < 1:
+        raise FieldImportError(line, f"ranking must be positive for {name}")
+    odds = _field(row, ODDS_KEYS)
+    if odds is not None:
+        odds = str(odds).strip()
+        if not ODDS_PATTERN.match(odds):
+            raise FieldImportError(line, f"invalid odds {odds!r} for {name}")
+    return name, ranking, odds
+
+
+def validated_rows(path):
+    for line, row in iter_field_file(path):
+        yield validate_row(line, row)
+
+
+def import_field(path, store):
+    """Stream path into the store's golfer table; returns the number of golfers imported."""
+    return store.import_golfers(validated_rows(path))
+
+
+def push_field(store, sheets_store):
+    """Write the store's sorted golfer table to the Golfers worksheet in one batch."""
+    sheets_store.replace_golfers(store.golfer_rows())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help='CSV or JSON-lines field file')
+    parser.add_argument('--db', default=None, help='Local draft store (default: DRAFT_DB_PATH or draft.db)')
+    parser.add_argument('--push', action='store_true', help='Also overwrite the Golfers worksheet')
+    parser.add_argument('--spreadsheet-id', default=None, help='Sheet to push to (default: SPREADSHEET_ID)')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    from dotenv import load_dotenv
+    load_dotenv(encoding='utf-8')
+
+    store = LocalDraftStore(args.db or os.getenv('DRAFT_DB_PATH', 'draft.db'))
+    try:
+        count = import_field(args.path, store)
+    except (OSError, ValueError) as e:
+        logger.error(f"Field import failed, field unchanged: {str(e)}")
+        sys.exit(1)
+    print(f"Imported {count} golfers")
+    if not store.is_seeded():
+        print("The draft board is seeded from the Sheet when the app first opens this store; the imported field is kept")
+
+    if args.push:
+        from sheets_client import SheetsClientManager
+        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
+        clients = SheetsClientManager(lambda: json.loads(os.environ['SERVICE_ACCOUNT_JSON']), scope)
+        spreadsheet_id = args.spreadsheet_id or os.environ['SPREADSHEET_ID']
+        sheets_store = SheetsDraftStore(
+            clients.worksheet(spreadsheet_id, 'Golfers'), clients.worksheet(spreadsheet_id, 'Draft Board')
+        )
+        push_field(store, sheets_store)
+        print(f"Pushed {count} golfers to the Golfers worksheet")
+
+
+if __name__ == '__main__':
+    main()
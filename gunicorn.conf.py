@@ -0,0 +1,20 @@
+import multiprocessing
+import os
+
+# Production serving: `gunicorn -c gunicorn.conf.py`
+# Workers share draft state through the SQLite file at DRAFT_DB_PATH (DRAFT_STORE must be 'sqlite').
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# SERVING_MODE=asgi runs asgi:app on uvicorn workers: polls and streams are served on an event
+# loop and only other requests take a thread (ASGI_THREADS per worker). The default runs the
+# Flask app on threaded workers, so long-lived /draft_stream connections don't pin a whole process each.
+if os.getenv('SERVING_MODE', 'wsgi') == 'asgi':
+    wsgi_app = 'asgi:app'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'app:app'
+    worker_class = 'gthread'
+    threads = int(os.getenv('GUNICORN_THREADS', '32'))
+timeout = 120
+# app.py starts its background threads at import; they have to be started in each worker, not the master
+preload_app = False
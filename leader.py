@@ -0,0 +1,54 @@
+import logging
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines run a single process anyway
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection(threading.Thread):
+    """Pick one process on this host to run singleton background services.
+
+    Every gunicorn worker starts one of these; the worker that gets an
+    exclusive flock on lock_path calls on_elected() and keeps the lock until
+    it exits, at which point the OS releases it and another worker takes over.
+    """
+
+    def __init__(self, lock_path, on_elected, retry_interval=5):
+        super().__init__(name='leader-election', daemon=True)
+        self.lock_path = lock_path
+        self.on_elected = on_elected
+        self.retry_interval = retry_interval
+        self.lock_file = None
+        self.stopped = threading.Event()
+
+    def try_acquire(self):
+        if fcntl is None:
+            return True
+        lock_file = open(self.lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self.lock_file = lock_file
+        return True
+
+    def stop(self):
+        """Stop campaigning and give up the lock so another process can take over."""
+        self.stopped.set()
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
+
+    def run(self):
+        while not self.stopped.is_set():
+            if self.try_acquire():
+                logger.info(f"Worker {os.getpid()} elected to run background services")
+                self.on_elected()
+                return
+            self.stopped.wait(self.retry_interval)
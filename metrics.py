@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+from collections import Counter as _Tally
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} counter'
+        with self.lock:
+            items = sorted(self.values.items())
+        for key, value in items:
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {value}'
+
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.series = {}
+
+    def observe(self, value, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self.lock:
+            series = self.series.get(key)
+            if series is None:
+                # Cumulative bucket counts, then sum and count
+                series = self.series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self):
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} histogram'
+        with self.lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self.series.items())
+        for key, (counts, total, count) in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                yield f'{self.name}_bucket{_format_labels(self.labelnames, key, [("le", bound)])} {bucket_count}'
+            yield f'{self.name}_bucket{_format_labels(self.labelnames, key, [("le", "+Inf")])} {count}'
+            yield f'{self.name}_sum{_format_labels(self.labelnames, key)} {total}'
+            yield f'{self.name}_count{_format_labels(self.labelnames, key)} {count}'
+
+
+class MetricsRegistry:
+    """Process-local metrics rendered in the Prometheus text exposition format.
+
+    Collectors are callables yielding (name, type, help, [(labels dict, value)])
+    for values read at scrape time, such as cache counters owned by other objects.
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        self.collectors.append(collector)
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collector in self.collectors:
+            for name, metric_type, documentation, samples in collector():
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {metric_type}')
+                for labels, value in samples:
+                    lines.append(f'{name}{_format_labels(labels.keys(), labels.values())} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.histogram(
+    'golfdraft_http_request_duration_seconds', 'Request latency by route.', ('route', 'method'))
+REQUESTS = REGISTRY.counter(
+    'golfdraft_http_requests_total', 'Requests by route and status code.', ('route', 'method', 'status'))
+SHEETS_CALLS = REGISTRY.counter(
+    'golfdraft_sheets_calls_total', 'Google Sheets API calls by gspread function.', ('function',))
+SHEETS_LATENCY = REGISTRY.histogram(
+    'golfdraft_sheets_call_duration_seconds', 'Google Sheets API call latency by gspread function.', ('function',))
+SHEETS_ERRORS = REGISTRY.counter(
+    'golfdraft_sheets_errors_total', 'Failed Google Sheets API calls by function and HTTP status.', ('function', 'status'))
+SHEETS_RATE_LIMITED = REGISTRY.counter(
+    'golfdraft_sheets_rate_limited_total', 'Calls refused by the client-side Sheets rate limiter.', ('kind',))
+SHEETS_THROTTLED = REGISTRY.counter(
+    'golfdraft_sheets_throttled_total', '429 responses received from Google Sheets.', ('kind',))
+BACKOFF_RETRIES = REGISTRY.counter(
+    'golfdraft_backoff_retries_total', 'Retries after a failed backend call.', ('function',))
+AUTOPICK_SKEW = REGISTRY.histogram(
+    'golfdraft_autopick_skew_seconds', 'How long after the turn deadline an autopick was committed.',
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60))
+
+
+def count_backoff(details):
+    """on_backoff handler for backoff decorators."""
+    BACKOFF_RETRIES.inc(function=details['target'].__name__)
+
+
+_sample_lock = threading.Lock()
+_sample_counts = _Tally()
+
+
+def debug_sampled(log, every, msg, *args):
+    """Log msg % args at DEBUG for one call in every; formatting only happens when it is emitted."""
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    with _sample_lock:
+        seen = _sample_counts[msg]
+        _sample_counts[msg] += 1
+    if seen % every == 0:
+        log.debug(msg, *args)
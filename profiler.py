@@ -0,0 +1,224 @@
+import cProfile
+import contextvars
+import functools
+import heapq
+import itertools
+import logging
+import marshal
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import nullcontext
+
+logger = logging.getLogger(__name__)
+
+# Trace of the request being handled in this context, or None when it is not sampled
+_current = contextvars.ContextVar('current_trace', default=None)
+_NULL_SPAN = nullcontext()
+
+
+class Trace:
+    """Timed spans of one sampled request, plus its cProfile data when enabled."""
+
+    def __init__(self, method, path, profile=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.method = method
+        self.path = path
+        self.route = None
+        self.status = None
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.duration = None
+        self.profile = profile
+        self.stack = []
+        # (span path, start offset, duration) in completion order
+        self.spans = []
+
+    def push(self, name):
+        self.stack.append((name, time.perf_counter()))
+
+    def pop(self):
+        name, started = self.stack.pop()
+        path = tuple(n for n, _ in self.stack) + (name,)
+        self.spans.append((path, started - self.started, time.perf_counter() - started))
+
+    def summary(self):
+        return {
+            'id': self.id,
+            'method': self.method,
+            'path': self.path,
+            'route': self.route,
+            'status': self.status,
+            'started_at': self.started_at,
+            'duration_ms': round(self.duration * 1000, 3),
+            'profiled': self.profile is not None,
+            'spans': [
+                {'span': '/'.join(path), 'start_ms': round(start * 1000, 3), 'duration_ms': round(duration * 1000, 3)}
+                for path, start, duration in sorted(self.spans, key=lambda s: s[1])
+            ]
+        }
+
+    def folded(self):
+        """Folded stacks ("root;span;child self-microseconds"), the input format of flamegraph.pl and speedscope."""
+        root = (f'{self.method} {self.route or self.path}',)
+        totals = defaultdict(float)
+        totals[()] = self.duration
+        for path, _, duration in self.spans:
+            totals[path] += duration
+        children = defaultdict(float)
+        for path, total in totals.items():
+            if path:
+                children[path[:-1]] += total
+        return [
+            f"{';'.join(root + path)} {max(int((total - children[path]) * 1e6), 0)}"
+            for path, total in sorted(totals.items())
+        ]
+
+
+class _Span:
+    __slots__ = ('trace', 'name')
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.trace.push(self.name)
+
+    def __exit__(self, *exc):
+        self.trace.pop()
+
+
+def span(name):
+    """Context manager timing a block as a span of the current trace; a no-op when not tracing."""
+    trace = _current.get()
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name)
+
+
+def traced(name):
+    """Decorator recording each call of the function as a span."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            trace = _current.get()
+            if trace is None:
+                return fn(*args, **kwargs)
+            trace.push(name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                trace.pop()
+        return wrapper
+    return decorator
+
+
+class RequestProfiler:
+    """On-demand request tracing for one worker process.
+
+    While enabled, sample_rate of requests get a Trace of their spans (and a
+    cProfile run if use_cprofile is set); the slowest max_traces are kept in
+    a bounded min-heap. While disabled, begin() returns after one attribute
+    check and every span is a shared no-op.
+    """
+
+    def __init__(self, max_traces=20):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.use_cprofile = False
+        self.max_traces = max_traces
+        self.lock = threading.Lock()
+        self.traces = []
+        self.sequence = itertools.count()
+        self.sampled = 0
+
+    def configure(self, enabled=None, sample_rate=None, use_cprofile=None, max_traces=None):
+        with self.lock:
+            if enabled is not None:
+                self.enabled = enabled
+            if sample_rate is not None:
+                self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+            if use_cprofile is not None:
+                self.use_cprofile = use_cprofile
+            if max_traces is not None:
+                self.max_traces = max(max_traces, 1)
+                while len(self.traces) > self.max_traces:
+                    heapq.heappop(self.traces)
+        logger.info(f"Request profiler {'enabled' if self.enabled else 'disabled'}, "
+                    f"sample rate {self.sample_rate}, cProfile {'on' if self.use_cprofile else 'off'}")
+
+    @staticmethod
+    def current():
+        """Trace of the request being handled, or None if it is not sampled."""
+        return _current.get()
+
+    def clear(self):
+        with self.lock:
+            self.traces = []
+
+    def begin(self, method, path):
+        if not self.enabled or random.random() >= self.sample_rate:
+            return
+        profile = None
+        if self.use_cprofile:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler is active in this interpreter; keep the spans only
+                profile = None
+        _current.set(Trace(method, path, profile))
+
+    def end(self, route=None, status=None):
+        trace = _current.get()
+        if trace is None:
+            return
+        _current.set(None)
+        if trace.profile is not None:
+            trace.profile.disable()
+        trace.duration = time.perf_counter() - trace.started
+        trace.route = route
+        trace.status = status
+        with self.lock:
+            self.sampled += 1
+            entry = (trace.duration, next(self.sequence), trace)
+            if len(self.traces) < self.max_traces:
+                heapq.heappush(self.traces, entry)
+            elif trace.duration > self.traces[0][0]:
+                heapq.heapreplace(self.traces, entry)
+
+    def slowest(self):
+        with self.lock:
+            return [trace for _, _, trace in sorted(self.traces, reverse=True)]
+
+    def get(self, trace_id):
+        return next((trace for trace in self.slowest() if trace.id == trace_id), None)
+
+    def status(self):
+        return {
+            'pid': os.getpid(),
+            'enabled': self.enabled,
+            'sample_rate': self.sample_rate,
+            'use_cprofile': self.use_cprofile,
+            'max_traces': self.max_traces,
+            'sampled': self.sampled,
+            'traces': [trace.summary() for trace in self.slowest()]
+        }
+
+    def pstats_dump(self, traces):
+        """cProfile data of the given traces merged, in the binary format pstats.Stats (and snakeviz) load."""
+        profiles = [trace.profile for trace in traces if trace.profile is not None]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return marshal.dumps(stats.stats)
+
+    def folded(self, traces):
+        return '\n'.join(line for trace in traces for line in trace.folded()) + '\n'
@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+
+from metrics import SHEETS_CALLS, SHEETS_ERRORS, SHEETS_LATENCY, SHEETS_RATE_LIMITED, SHEETS_THROTTLED
+from profiler import span
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimited(Exception):
+    """No Sheets quota left for this call right now; serve cached data or retry later."""
+
+
+class TokenBucket:
+    """Per-minute budget refilled continuously, allowing bursts up to one minute's worth."""
+
+    def __init__(self, per_minute):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.urgent_waiters = 0
+        self.cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, reserve=0):
+        """Take a token without waiting, leaving at least reserve tokens (and any waiting urgent caller) alone."""
+        with self.cond:
+            self._refill()
+            if self.urgent_waiters or self.tokens - 1 < reserve:
+                return False
+            self.tokens -= 1
+            return True
+
+    def acquire(self, timeout):
+        """Take a token, waiting up to timeout seconds for one to refill."""
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self.urgent_waiters += 1
+            try:
+                while True:
+                    self._refill()
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self.cond.wait(min(remaining, (1 - self.tokens) / self.rate))
+            finally:
+                self.urgent_waiters -= 1
+                self.cond.notify_all()
+
+    def drain(self):
+        """The server says we are over quota: spend what we thought we had left."""
+        with self.cond:
+            self._refill()
+            self.tokens = min(self.tokens, 0.0)
+
+
+class SheetsRateLimiter:
+    """Client-side token buckets for the Sheets read and write quotas.
+
+    Urgent calls (anything on the path of committing a pick) may wait up to
+    urgent_timeout for a token and can spend the reserved slice of the read
+    budget; everything else fails fast with RateLimited so polling traffic
+    falls back to cached data and never queues ahead of a pick. Reserved
+    calls (the draft snapshot refresh) never wait either, but may also
+    spend the reserved slice, so polling cannot starve the refresh.
+    """
+
+    def __init__(self, read_per_minute=60, write_per_minute=60, read_reserve=0.1, urgent_timeout=10):
+        self.buckets = {'read': TokenBucket(read_per_minute), 'write': TokenBucket(write_per_minute)}
+        self.reserves = {'read': int(read_per_minute * read_reserve), 'write': 0}
+        self.urgent_timeout = urgent_timeout
+
+    def acquire(self, kind, urgent=False, reserved=False):
+        bucket = self.buckets[kind]
+        if urgent:
+            acquired = bucket.acquire(self.urgent_timeout)
+        else:
+            acquired = bucket.try_acquire(0 if reserved else self.reserves[kind])
+        if not acquired:
+            SHEETS_RATE_LIMITED.inc(kind=kind)
+            raise RateLimited(f"Sheets {kind} budget exhausted")
+
+    def call(self, kind, fn, *args, urgent=False, reserved=False, **kwargs):
+        """Run one gspread call against the kind ('read' or 'write') budget."""
+        function = fn.__name__
+        with span(f'sheets.{function}'):
+            self.acquire(kind, urgent, reserved)
+            SHEETS_CALLS.inc(function=function)
+            try:
+                with SHEETS_LATENCY.time(function=function):
+                    return fn(*args, **kwargs)
+            except Exception as e:
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                SHEETS_ERRORS.inc(function=function, status=status or 'none')
+                if status == 429:
+                    SHEETS_THROTTLED.inc(kind=kind)
+                    self.buckets[kind].drain()
+                    logger.warning(f"Sheets returned 429 for a {kind}, draining the {kind} budget")
+                raise
@@ -0,0 +1,212 @@
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Draft that module-level helpers in app.py act on when running outside a request (background threads)
+active_draft = contextvars.ContextVar('active_draft', default=None)
+
+
+class LeagueConfig:
+    """Static configuration of one hosted draft: its spreadsheet, event and users."""
+
+    def __init__(self, draft_id, spreadsheet_id, event, user_player_mapping, credentials, db_path):
+        self.draft_id = draft_id
+        self.spreadsheet_id = spreadsheet_id
+        self.event = event
+        self.user_player_mapping = user_player_mapping
+        self.credentials = credentials
+        self.db_path = db_path
+
+
+def load_league_configs(path, drafts_dir):
+    """Read extra leagues from a JSON file of {draft_id: {spreadsheet_id, event, players, users}}."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        raw = json.load(f)
+    configs = {}
+    for draft_id, league in raw.items():
+        configs[draft_id] = LeagueConfig(
+            draft_id,
+            league['spreadsheet_id'],
+            league.get('event', {'name': draft_id, 'location': ''}),
+            league['players'],
+            league['users'],
+            league.get('db_path', os.path.join(drafts_dir, f'{draft_id}.db'))
+        )
+    logger.info(f"Loaded {len(configs)} league configs from {path}")
+    return configs
+
+
+class Draft:
+    """Per-draft runtime state: store, caches, turn engine, stream broker and background services."""
+
+    def __init__(self, config):
+        self.config = config
+        self.draft_id = config.draft_id
+        self.event = config.event
+        self.user_player_mapping = config.user_player_mapping
+        self.credentials = config.credentials
+        self.last_access = time.monotonic()
+        # Requests using this draft right now; guarded by the registry's lock
+        self.users = 0
+        self.store = None
+        self.sheet_sync_worker = None
+        self.cache = None
+        self.fragments = None
+        self.broker = None
+        self.state_history = None
+        self.autopick_lock = threading.Lock()
+        # Start time this process wrote, until the snapshot shows it
+        self.start_time_lock = threading.Lock()
+        self.draft_start_time = None
+        self.engine = None
+        self.availability = None
+        self.turn_scheduler = None
+        self.leader_election = None
+        self.version_watcher = None
+        self.queue_watcher = None
+        self.standings = None
+        self.leaderboard = None
+
+    def bind(self, fn):
+        """Wrap fn so it runs with this draft active, for use as a background thread callback."""
+        def bound(*args, **kwargs):
+            with using_draft(self):
+                return fn(*args, **kwargs)
+        return bound
+
+    def is_busy(self):
+        """A draft serving requests, with connected clients or a running turn clock (started and not complete) must not be evicted."""
+        if self.users or (self.broker and self.broker.subscribers):
+            return True
+        if self.engine is None or self.engine.is_complete():
+            return False
+        # The first turn's clock runs from the draft start time, before any pick is made
+        snapshot = self.cache.peek('snapshot') if self.cache else None
+        return self.engine.has_picks or getattr(snapshot, 'draft_start_time', None) is not None
+
+    def approx_bytes(self):
+        snapshot = self.cache.peek('snapshot') if self.cache else None
+        return getattr(snapshot, 'approx_bytes', 0)
+
+    def close(self, timeout=5):
+        """Stop this draft's background threads and close its store; pending Sheet writes stay in the outbox."""
+        services = [s for s in (self.turn_scheduler, self.sheet_sync_worker, self.version_watcher, self.queue_watcher, self.leader_election) if s is not None]
+        for service in services:
+            service.stop()
+        for service in services:
+            if service.is_alive():
+                service.join(timeout)
+        if hasattr(self.store, 'close'):
+            self.store.close()
+        logger.info(f"Closed draft {self.draft_id}")
+
+
+@contextmanager
+def using_draft(draft):
+    token = active_draft.set(draft)
+    try:
+        yield draft
+    finally:
+        active_draft.reset(token)
+
+
+class DraftRegistry:
+    """Drafts keyed by id, opened on first use and evicted least-recently-used.
+
+    Eviction keeps at most max_drafts open and their snapshots under roughly
+    max_bytes, skipping pinned and busy drafts. get(..., use=True) counts the
+    caller as a user of the draft until release(), so a draft is never closed
+    under a request that is still using its store.
+    """
+
+    def __init__(self, configs, open_draft, max_drafts=32, max_bytes=256 * 1024 * 1024, pinned=()):
+        self.configs = configs
+        self.open_draft = open_draft
+        self.max_drafts = max_drafts
+        self.max_bytes = max_bytes
+        self.pinned = set(pinned)
+        self.lock = threading.Lock()
+        self.drafts = OrderedDict()
+        self.opening = {}
+
+    def __contains__(self, draft_id):
+        return draft_id in self.configs
+
+    def open_drafts(self):
+        with self.lock:
+            return list(self.drafts.values())
+
+    def peek(self, draft_id, use=False):
+        """The draft if it is already open, else None; never opens one."""
+        with self.lock:
+            draft = self.drafts.get(draft_id)
+            if draft is not None:
+                self.drafts.move_to_end(draft_id)
+                draft.last_access = time.monotonic()
+                draft.users += use
+            return draft
+
+    def get(self, draft_id, use=False):
+        """Return the open draft for draft_id, opening it once if needed; KeyError for unknown ids.
+
+        With use=True the caller must release() the draft when done with it.
+        """
+        if draft_id not in self.configs:
+            raise KeyError(draft_id)
+        with self.lock:
+            draft = self.drafts.get(draft_id)
+            if draft is not None:
+                self.drafts.move_to_end(draft_id)
+                draft.last_access = time.monotonic()
+                draft.users += use
+                return draft
+            opening = self.opening.get(draft_id)
+            if opening is None:
+                opening = self.opening[draft_id] = threading.Lock()
+        # Only one thread opens a given draft; the rest wait for it
+        with opening:
+            with self.lock:
+                draft = self.drafts.get(draft_id)
+                if draft is not None:
+                    draft.users += use
+            if draft is None:
+                logger.info(f"Opening draft {draft_id}")
+                draft = self.open_draft(self.configs[draft_id])
+                with self.lock:
+                    self.drafts[draft_id] = draft
+                    self.opening.pop(draft_id, None)
+                    draft.users += use
+                self.evict()
+        return draft
+
+    def release(self, draft):
+        """End a use started with get(..., use=True) or peek(..., use=True)."""
+        with self.lock:
+            draft.users -= 1
+
+    def evict(self):
+        """Close least-recently-used idle drafts until within the count and memory caps."""
+        evicted = []
+        with self.lock:
+            for draft_id in list(self.drafts):
+                total_bytes = sum(d.approx_bytes() for d in self.drafts.values())
+                if len(self.drafts) <= self.max_drafts and total_bytes <= self.max_bytes:
+                    break
+                draft = self.drafts[draft_id]
+                if draft_id in self.pinned or draft.is_busy():
+                    continue
+                evicted.append(self.drafts.pop(draft_id))
+            if len(self.drafts) > self.max_drafts:
+                logger.warning(f"{len(self.drafts)} drafts open, above the cap of {self.max_drafts}; the rest are busy")
+        for draft in evicted:
+            logger.info(f"Evicting idle draft {draft.draft_id}")
+            draft.close()
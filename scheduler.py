@@ -0,0 +1,77 @@
+import logging
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class TurnScheduler(threading.Thread):
+    """Background thread that fires the autopick when the current turn's clock runs out.
+
+    next_deadline() returns (turn_key, deadline) for the turn on the clock, or
+    None when no turn is running. on_deadline(turn_key) returns True once the
+    turn is dealt with and is then not called again for that turn_key; when it
+    returns False or raises (e.g. the pick hit a Sheets 429) it is retried with
+    exponential backoff, or straight away on a rearm(). Call rearm() after any
+    pick so the timer follows the new turn.
+    """
+
+    def __init__(self, next_deadline, on_deadline, idle_interval=30, retry_after=1):
+        super().__init__(name='turn-scheduler', daemon=True)
+        self.next_deadline = next_deadline
+        self.on_deadline = on_deadline
+        self.idle_interval = idle_interval
+        self.wake = threading.Event()
+        self.stopped = threading.Event()
+        self.fired_key = None
+        self.retry_after = retry_after
+        self.failures = 0
+        self.failed_key = None
+
+    def rearm(self):
+        self.wake.set()
+
+    def stop(self):
+        self.stopped.set()
+        self.wake.set()
+
+    def _sleep(self, seconds):
+        self.wake.wait(timeout=seconds)
+        self.wake.clear()
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                turn = self.next_deadline()
+            except Exception as e:
+                logger.error(f"Turn scheduler could not determine the next deadline: {str(e)}")
+                turn = None
+            if turn is None:
+                self._sleep(self.idle_interval)
+                continue
+
+            turn_key, deadline = turn
+            delay = (deadline - datetime.now()).total_seconds()
+            if delay > 0:
+                logger.info(f"Turn scheduler armed for {turn_key} in {delay:.1f}s")
+                self._sleep(min(delay, self.idle_interval))
+                continue
+            if turn_key == self.fired_key:
+                # Already handled this turn; wait for a rearm
+                self._sleep(self.idle_interval)
+                continue
+
+            try:
+                handled = self.on_deadline(turn_key)
+            except Exception as e:
+                logger.error(f"Turn scheduler deadline handler failed for {turn_key}: {str(e)}")
+                handled = False
+            if handled:
+                self.fired_key = turn_key
+                self.failures = 0
+                continue
+            self.failures = self.failures + 1 if turn_key == self.failed_key else 1
+            self.failed_key = turn_key
+            retry_in = min(self.retry_after * 2 ** (self.failures - 1), self.idle_interval)
+            logger.warning(f"Turn {turn_key} was not handled (attempt {self.failures}), retrying in {retry_in}s")
+            self._sleep(retry_in)
@@ -0,0 +1,266 @@
+import csv
+import json
+import logging
+import os
+import threading
+from collections import deque
+
+import numpy as np
+import requests
+
+logger = logging.getLogger(__name__)
+
+HOLES_PER_ROUND = 18
+OUT_STATUSES = {'cut', 'mc', 'wd', 'dq'}
+
+
+def normalize_name(name):
+    return ' '.join(str(name).split()).casefold()
+
+
+def read_score_rows(source, timeout=10):
+    """Score rows from a CSV or JSON file, or a JSON feed URL.
+
+    Each row has golfer, round and to_par, plus optional thru (holes completed,
+    default 18) and status ('cut', 'wd', ...). A hole-by-hole feed sends the
+    same round again with a higher thru.
+    """
+    if source.startswith(('http://', 'https://')):
+        response = requests.get(source, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+    elif source.endswith('.csv'):
+        with open(source, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+    else:
+        with open(source, encoding='utf-8') as f:
+            data = json.load(f)
+    return data['scores'] if isinstance(data, dict) else data
+
+
+class EventScores:
+    """Round-by-round scores to par for one event's field, in NumPy arrays indexed by golfer.
+
+    Row 0 is a sentinel that always scores 0, for drafted golfers missing from
+    the feed. Golfer totals and projections are recomputed with array
+    operations on every update, and the per-golfer change is kept in a short
+    history so TeamStandings can apply it incrementally.
+    """
+
+    def __init__(self, rounds=4, history=64):
+        self.rounds = rounds
+        self.lock = threading.Lock()
+        self.index = {}
+        self.names = ['']
+        self.scores = np.full((64, rounds), np.nan)
+        self.thru = np.zeros((64, rounds), dtype=np.int16)
+        self.out = np.zeros(64, dtype=bool)
+        self.totals = np.zeros(64)
+        self.projected = np.zeros(64)
+        self.version = 0
+        self.changes = deque(maxlen=history)
+
+    @property
+    def size(self):
+        return len(self.names)
+
+    def golfer_row(self, name):
+        """Row of a golfer, or the 0 sentinel if the feed has never mentioned them."""
+        return self.index.get(normalize_name(name), 0)
+
+    def _add_golfer(self, name):
+        row = self.index[normalize_name(name)] = len(self.names)
+        self.names.append(name)
+        if row >= len(self.out):
+            grow = len(self.out)
+            self.scores = np.vstack([self.scores, np.full((grow, self.rounds), np.nan)])
+            self.thru = np.vstack([self.thru, np.zeros((grow, self.rounds), dtype=np.int16)])
+            self.out = np.concatenate([self.out, np.zeros(grow, dtype=bool)])
+            self.totals = np.concatenate([self.totals, np.zeros(grow)])
+            self.projected = np.concatenate([self.projected, np.zeros(grow)])
+        return row
+
+    def apply(self, rows):
+        """Merge score rows into the arrays; returns True if any golfer's total or projection moved."""
+        with self.lock:
+            for row in rows:
+                name = row.get('golfer')
+                if not name:
+                    continue
+                golfer = self.index.get(normalize_name(name)) or self._add_golfer(name)
+                status = str(row.get('status') or '').strip().lower()
+                self.out[golfer] = status in OUT_STATUSES
+                if row.get('round') in (None, '') or row.get('to_par') in (None, ''):
+                    continue
+                r = int(row['round']) - 1
+                if not 0 <= r < self.rounds:
+                    continue
+                self.scores[golfer, r] = float(row['to_par'])
+                thru = row.get('thru')
+                self.thru[golfer, r] = HOLES_PER_ROUND if thru in (None, '', 'F') else int(thru)
+            return self._recompute()
+
+    def _recompute(self):
+        n = self.size
+        scores, thru, out = self.scores[:n], self.thru[:n], self.out[:n]
+        raw = np.nansum(scores, axis=1)
+        played = np.isfinite(scores)
+        # A golfer who is out scores the worst round posted by anyone still playing
+        active = played & ~out[:, None]
+        any_active = active.any(axis=0)
+        worst = np.where(any_active, np.max(np.where(active, scores, -np.inf), axis=0), 0.0)
+        missed = out[:, None] & ~played
+        totals = raw + (missed * worst).sum(axis=1)
+        # Extrapolate the remaining holes at the golfer's pace, shrunk toward par by one even round
+        holes = thru.sum(axis=1)
+        holes_left = self.rounds * HOLES_PER_ROUND - holes
+        pace = raw / (holes + HOLES_PER_ROUND)
+        unplayed_penalty = worst.max() if any_active.any() else 0.0
+        penalty = np.where(any_active, worst, unplayed_penalty)
+        projected = np.where(out, raw + (missed * penalty).sum(axis=1), raw + pace * holes_left)
+        totals[0] = projected[0] = 0.0
+
+        d_totals = totals - self.totals[:n]
+        d_projected = projected - self.projected[:n]
+        changed = np.flatnonzero((d_totals != 0) | (d_projected != 0))
+        if not changed.size:
+            return False
+        self.totals[:n] = totals
+        self.projected[:n] = projected
+        self.version += 1
+        self.changes.append((self.version, changed, d_totals[changed], d_projected[changed]))
+        return True
+
+    def changes_since(self, version):
+        """Per-golfer deltas after version, or None if they have left the history."""
+        with self.lock:
+            if version == self.version:
+                return self.version, []
+            if not self.changes or self.changes[0][0] > version + 1:
+                return None
+            return self.version, [change[1:] for change in self.changes if change[0] > version]
+
+
+def rank(values):
+    """1-based standings, lowest score first; ties share a rank."""
+    return np.searchsorted(np.sort(values), values, side='left') + 1
+
+
+class TeamStandings:
+    """One league's drafted teams scored against an EventScores, kept up to date by applying deltas.
+
+    Concurrent leaderboard renders share one instance; the lock keeps them from applying the same deltas twice.
+    """
+
+    def __init__(self, scores, player_picks):
+        self.scores = scores
+        self.lock = threading.RLock()
+        self.players = list(player_picks)
+        width = max([len(golfers) for golfers in player_picks.values()] + [1])
+        self.names = [[self._pick_name(pick) for pick in golfers] for golfers in player_picks.values()]
+        # Rows into the score arrays, padded with the 0 sentinel; resolved again as the field grows
+        self.teams = np.zeros((len(self.players), width), dtype=np.intp)
+        self.resolved_size = 0
+        self.version = None
+        self.totals = np.zeros(len(self.players))
+        self.projected = np.zeros(len(self.players))
+
+    @staticmethod
+    def _pick_name(pick):
+        return pick['Golfer'] if isinstance(pick, dict) else pick
+
+    def _resolve(self):
+        for i, golfers in enumerate(self.names):
+            for j, name in enumerate(golfers):
+                self.teams[i, j] = self.scores.golfer_row(name)
+        self.resolved_size = self.scores.size
+
+    def sync(self):
+        """Bring team totals up to the latest scores: apply deltas if possible, else recompute."""
+        with self.lock:
+            self._sync()
+
+    def _sync(self):
+        changes = None if self.version is None or self.resolved_size != self.scores.size else self.scores.changes_since(self.version)
+        if changes is None:
+            with self.scores.lock:
+                self._resolve()
+                self.totals = self.scores.totals[self.teams].sum(axis=1)
+                self.projected = self.scores.projected[self.teams].sum(axis=1)
+                self.version = self.scores.version
+            return
+        version, deltas = changes
+        for changed, d_totals, d_projected in deltas:
+            if not np.isin(changed, self.teams).any():
+                continue
+            lookup = np.zeros(self.scores.size)
+            lookup[changed] = d_totals
+            self.totals = self.totals + lookup[self.teams].sum(axis=1)
+            lookup[changed] = d_projected
+            self.projected = self.projected + lookup[self.teams].sum(axis=1)
+        self.version = version
+
+    def standings(self):
+        """Leaderboard rows sorted by current total."""
+        with self.lock:
+            self._sync()
+            totals, projected_totals = self.totals, self.projected
+            with self.scores.lock:
+                golfer_totals = self.scores.totals[self.teams]
+                golfer_thru = self.scores.thru[self.teams].sum(axis=2)
+                golfer_out = self.scores.out[self.teams]
+        current, projected = rank(totals), rank(projected_totals)
+        rows = []
+        for i in np.argsort(totals, kind='stable'):
+            rows.append({
+                'player': self.players[i],
+                'rank': int(current[i]),
+                'total': float(totals[i]),
+                'projected': round(float(projected_totals[i]), 1),
+                'projected_rank': int(projected[i]),
+                'golfers': [
+                    {'golfer': name, 'total': float(golfer_totals[i, j]), 'holes': int(golfer_thru[i, j]), 'out': bool(golfer_out[i, j])}
+                    for j, name in enumerate(self.names[i])
+                ]
+            })
+        return rows
+
+
+class ScoreFeed:
+    """Background poller that feeds one source (file path or URL) into an EventScores.
+
+    Files are re-read only when their modification time changes.
+    """
+
+    def __init__(self, source, scores, interval=60):
+        self.source = source
+        self.scores = scores
+        self.interval = interval
+        self.mtime = None
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def poll(self):
+        if not self.source.startswith(('http://', 'https://')):
+            mtime = os.path.getmtime(self.source)
+            if mtime == self.mtime:
+                return False
+            self.mtime = mtime
+        return self.scores.apply(read_score_rows(self.source))
+
+    def _run(self):
+        while not self.stopped.is_set():
+            try:
+                if self.poll():
+                    logger.info(f"Scores updated from {self.source} (version {self.scores.version})")
+            except Exception as e:
+                logger.error(f"Error reading scores from {self.source}: {str(e)}")
+            self.stopped.wait(self.interval)
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name='score-feed', daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
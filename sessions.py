@@ -0,0 +1,132 @@
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+logger = logging.getLogger(__name__)
+
+
+def load_secret_key(path):
+    """Read the signing key from path, creating it once (atomically) so every worker and restart shares it."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    key = secrets.token_bytes(32)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another worker created it first
+        with open(path, 'rb') as f:
+            return f.read()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    logger.info(f"Generated a new session secret key at {path}")
+    return key
+
+
+class SQLiteSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(self):
+            self.modified = True
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+
+
+class SQLiteSessionInterface(SessionInterface):
+    """Server-side sessions in SQLite with TTL eviction; the cookie holds only a signed session id.
+
+    Every request reads its session by primary key (cheap under WAL) rather
+    than from a per-worker cache, which would serve stale data once another
+    worker changed or deleted the row. A session is written back only when
+    it changes, and expired rows are pruned every evict_interval seconds.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, path, evict_interval=300):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS sessions (sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)")
+        self.evict_interval = evict_interval
+        self.evicted_at = 0
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt='flask-session-id')
+
+    def _evict_expired(self, now):
+        # Caller holds self.lock
+        if now - self.evicted_at > self.evict_interval:
+            self.evicted_at = now
+            self.conn.execute("DELETE FROM sessions WHERE expires <= ?", (now,))
+
+    def _load(self, sid):
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute("SELECT data FROM sessions WHERE sid = ? AND expires > ?", (sid, now)).fetchone()
+            self._evict_expired(now)
+        return self.serializer.loads(row[0]) if row else None
+
+    def open_session(self, app, request):
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(cookie).decode()
+            except BadSignature:
+                sid = None
+            if sid:
+                data = self._load(sid)
+                if data is not None:
+                    return SQLiteSession(data, sid=sid)
+        return SQLiteSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if not session:
+            if session.modified:
+                with self.lock:
+                    self.conn.execute("DELETE FROM sessions WHERE sid = ?", (session.sid,))
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+        if not self.should_set_cookie(app, session):
+            return
+        expires = self.get_expiration_time(app, session)
+        ttl = expires.timestamp() if expires else time.time() + app.permanent_session_lifetime.total_seconds()
+        if session.modified or session.new:
+            data = self.serializer.dumps(dict(session))
+            with self.lock:
+                self.conn.execute("INSERT OR REPLACE INTO sessions (sid, data, expires) VALUES (?, ?, ?)", (session.sid, data, ttl))
+                self._evict_expired(time.time())
+        response.set_cookie(
+            name, self._signer(app).sign(session.sid).decode(), expires=expires,
+            httponly=self.get_cookie_httponly(app), domain=domain, path=path,
+            secure=self.get_cookie_secure(app), samesite=self.get_cookie_samesite(app)
+        )
+
+
+def configure_sessions(app, backend, db_path='sessions.db'):
+    """Install the session backend: 'cookie' (signed, stateless), 'sqlite' or 'filesystem' (flask_session)."""
+    if backend == 'cookie':
+        return
+    if backend == 'sqlite':
+        app.session_interface = SQLiteSessionInterface(db_path)
+    elif backend == 'filesystem':
+        from flask_session import Session
+        app.config['SESSION_TYPE'] = 'filesystem'
+        Session(app)
+    else:
+        raise ValueError(f"Unknown SESSION_BACKEND {backend!r}")
+    logger.info(f"Using {backend} session backend")
@@ -0,0 +1,115 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+
+import gspread
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class LazyWorksheet:
+    """Worksheet handle that knows its title up front and opens the worksheet on first real use."""
+
+    def __init__(self, manager, spreadsheet_id, title):
+        self.manager = manager
+        self.spreadsheet_id = spreadsheet_id
+        self.title = title
+        self.lock = threading.Lock()
+        self.worksheet = None
+
+    def resolve(self):
+        if self.worksheet is None:
+            with self.lock:
+                if self.worksheet is None:
+                    spreadsheet = self.manager.spreadsheet(self.spreadsheet_id)
+                    self.worksheet = self.manager.call(spreadsheet.worksheet, self.title)
+        return self.worksheet
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+
+class SheetsClientManager:
+    """One process-wide gspread client, created on first use.
+
+    Credentials are parsed and the client authorized lazily, its HTTP session
+    keeps a connection pool sized for the server's threads, spreadsheets are
+    opened once and reused, and a background thread refreshes the access token
+    ahead of expiry so no request pays for the refresh.
+    """
+
+    def __init__(self, load_service_account_info, scopes, limiter=None, pool_size=32, refresh_margin=300, timeout=None):
+        self.load_service_account_info = load_service_account_info
+        self.scopes = scopes
+        self.limiter = limiter
+        self.pool_size = pool_size
+        self.refresh_margin = refresh_margin
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.credentials = None
+        self.gc = None
+        self.spreadsheets = {}
+        self.refresher = None
+        self.stopped = threading.Event()
+
+    def stop(self):
+        self.stopped.set()
+
+    def call(self, fn, *args):
+        if self.limiter is None:
+            return fn(*args)
+        return self.limiter.call('read', fn, *args, urgent=True)
+
+    def client(self):
+        if self.gc is None:
+            with self.lock:
+                if self.gc is None:
+                    self.credentials = Credentials.from_service_account_info(self.load_service_account_info(), scopes=self.scopes)
+                    gc = gspread.authorize(self.credentials)
+                    if self.timeout and hasattr(gc, 'set_timeout'):
+                        # Per-call HTTP timeout, so a hung Sheets request frees its thread
+                        gc.set_timeout(self.timeout)
+                    session = getattr(getattr(gc, 'http_client', None), 'session', None)
+                    if session is not None:
+                        # Default pools hold 10 connections; gthread workers run more concurrent Sheets calls
+                        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+                        session.mount('https://', adapter)
+                    self.gc = gc
+                    if hasattr(self.credentials, 'refresh'):
+                        self.refresher = threading.Thread(target=self._refresh_loop, name='sheets-token-refresh', daemon=True)
+                        self.refresher.start()
+                    logger.info("Authorized Google Sheets client")
+        return self.gc
+
+    def spreadsheet(self, spreadsheet_id):
+        spreadsheet = self.spreadsheets.get(spreadsheet_id)
+        if spreadsheet is None:
+            client = self.client()
+            with self.lock:
+                spreadsheet = self.spreadsheets.get(spreadsheet_id)
+                if spreadsheet is None:
+                    spreadsheet = self.spreadsheets[spreadsheet_id] = self.call(client.open_by_key, spreadsheet_id)
+        return spreadsheet
+
+    def worksheet(self, spreadsheet_id, title):
+        return LazyWorksheet(self, spreadsheet_id, title)
+
+    def _refresh_loop(self):
+        credentials = self.credentials
+        while not self.stopped.is_set():
+            expiry = getattr(credentials, 'expiry', None)
+            # google-auth keeps expiry as naive UTC
+            if expiry is None or expiry - datetime.utcnow() < timedelta(seconds=self.refresh_margin):
+                try:
+                    credentials.refresh(Request())
+                    logger.info(f"Refreshed Sheets access token, valid until {credentials.expiry}")
+                except Exception as e:
+                    logger.error(f"Sheets token refresh failed, retrying in 60s: {str(e)}")
+                    self.stopped.wait(60)
+                    continue
+                expiry = credentials.expiry
+            wait = (expiry - datetime.utcnow()).total_seconds() - self.refresh_margin if expiry else 60
+            self.stopped.wait(max(wait, 30))
@@ -0,0 +1,166 @@
+"""Monte Carlo draft simulator for tuning the turn clock and the autopick policy.
+
+Runs many snake drafts at once: the pick order is DraftEngine's schedule, and
+a turn whose clock runs out is autopicked with the app's rule (best-ranked
+golfer still available). Think times are drawn with NumPy for a whole batch
+of drafts at a time, manual picks follow a pluggable strategy, and batches
+run across a process pool.
+
+    python simulate.py --drafts 100000 --turn-durations 60,120,180 --strategies best,top5,adp
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine import DraftEngine
+
+
+def pick_best(available, ranks, rng):
+    """The autopick rule: best-ranked golfer still available (the field is sorted by ranking)."""
+    return available.argmax(axis=1)
+
+
+def pick_top(k):
+    def strategy(available, ranks, rng):
+        """Uniformly among the k best-ranked available golfers."""
+        order = np.cumsum(available, axis=1)
+        limit = np.minimum(available.sum(axis=1), k)
+        target = (rng.random(len(available)) * limit).astype(np.int64) + 1
+        return (available & (order == target[:, None])).argmax(axis=1)
+    return strategy
+
+
+def pick_adp(available, ranks, rng, spread=0.35):
+    """Each player ranks the field by their own noisy read of log(ranking), then takes their best."""
+    perceived = np.log(ranks).astype(np.float32)[None, :] + np.float32(spread) * rng.standard_normal(available.shape, dtype=np.float32)
+    return np.where(available, perceived, np.inf).argmin(axis=1)
+
+
+STRATEGIES = {
+    'best': pick_best,
+    'top3': pick_top(3),
+    'top5': pick_top(5),
+    'top10': pick_top(10),
+    'adp': pick_adp,
+}
+
+
+# Manual picks are made among the best WINDOW_FACTOR x (picks per draft) golfers of the field
+WINDOW_FACTOR = 3
+
+
+def golfer_strength(ranks):
+    """Expected strokes over the best golfer, growing with log(world ranking); lower is stronger."""
+    return 2.0 * np.log(ranks)
+
+
+def simulate_batch(args):
+    """Run one batch of drafts; returns per-draft wall clock, autopick counts and team strengths."""
+    drafts, players, rounds, ranks, turn_duration, strategy, think, seed = args
+    rng = np.random.default_rng(seed)
+    engine = DraftEngine(range(players), rounds=rounds, turn_duration=turn_duration)
+    seats = np.array([player for player, _ in engine.schedule])
+    n_picks = len(seats)
+
+    # Think time per pick: a lognormal draw scaled by each player's own pace; absent players never pick
+    pace = rng.lognormal(0, think['player_sigma'], size=(drafts, players))
+    absent = rng.random((drafts, players)) < think['absent_rate']
+    times = rng.lognormal(np.log(think['median']), think['sigma'], size=(drafts, n_picks)) * pace[:, seats]
+    autopicked = absent[:, seats] | (times >= turn_duration)
+    durations = np.where(autopicked, turn_duration + think['autopick_delay'], times)
+
+    # Nobody reaches past the best few golfers left, so strategies only look at a window of the field
+    window = min(len(ranks), WINDOW_FACTOR * n_picks)
+    ranks = ranks[:window]
+    pick = STRATEGIES[strategy]
+    strength = golfer_strength(ranks)
+    available = np.ones((drafts, window), dtype=bool)
+    team_strength = np.zeros((drafts, players))
+    rows = np.arange(drafts)
+    for i, seat in enumerate(seats):
+        choice = pick_best(available, ranks, rng)
+        manual = ~autopicked[:, i]
+        if manual.any():
+            choice[manual] = pick(available[manual], ranks, rng)
+        available[rows, choice] = False
+        team_strength[:, seat] += strength[choice]
+    return durations.sum(axis=1), autopicked.sum(axis=1), team_strength
+
+
+def run(drafts, players, rounds, ranks, turn_duration, strategy, think, batch_size, pool, seed):
+    batches = [min(batch_size, drafts - start) for start in range(0, drafts, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    jobs = [(n, players, rounds, ranks, turn_duration, strategy, think, s) for n, s in zip(batches, seeds)]
+    results = list(pool.map(simulate_batch, jobs)) if pool else [simulate_batch(job) for job in jobs]
+    wall_clock = np.concatenate([r[0] for r in results])
+    autopicks = np.concatenate([r[1] for r in results])
+    teams = np.concatenate([r[2] for r in results])
+    return wall_clock, autopicks, teams
+
+
+def report(turn_duration, strategy, wall_clock, autopicks, teams, n_picks):
+    spread = teams.max(axis=1) - teams.min(axis=1)
+    p5, p50, p95 = np.percentile(wall_clock / 60, [5, 50, 95])
+    t5, t50, t95 = np.percentile(teams, [5, 50, 95])
+    print(f"{turn_duration:>6}s {strategy:>6}  "
+          f"draft min p5/p50/p95 {p5:6.1f} {p50:6.1f} {p95:6.1f}  "
+          f"autopick {autopicks.sum() / (len(autopicks) * n_picks):6.1%}  "
+          f"team p5/p50/p95 {t5:5.1f} {t50:5.1f} {t95:5.1f}  "
+          f"spread p50 {np.median(spread):5.1f}  "
+          f"by seat {' '.join(f'{v:.1f}' for v in teams.mean(axis=0))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--drafts', type=int, default=10000)
+    parser.add_argument('--players', type=int, default=12)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--field-size', type=int, default=156)
+    parser.add_argument('--field', default=None, help='Field file (as for field_import.py) to take rankings from')
+    parser.add_argument('--turn-durations', default='180', help='Comma-separated turn clocks in seconds')
+    parser.add_argument('--strategies', default='best', help=f"Comma-separated, from {', '.join(STRATEGIES)}")
+    parser.add_argument('--median-pick', type=float, default=45, help='Median seconds to make a pick')
+    parser.add_argument('--pick-sigma', type=float, default=0.8, help='Lognormal sigma of a single pick time')
+    parser.add_argument('--player-sigma', type=float, default=0.4, help='Lognormal sigma of per-player pace')
+    parser.add_argument('--absent-rate', type=float, default=0.03, help='Chance a player never shows up')
+    parser.add_argument('--autopick-delay', type=float, default=0.5, help='Seconds from deadline to autopick commit')
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Processes; 1 runs inline')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.field:
+        from field_import import validated_rows
+        ranks = np.sort(np.array([ranking for _, ranking, _ in validated_rows(args.field)], dtype=float))
+    else:
+        ranks = np.arange(1, args.field_size + 1, dtype=float)
+    if len(ranks) < args.players * args.rounds:
+        parser.error(f"A field of {len(ranks)} is too small for {args.players} players x {args.rounds} rounds")
+    strategies = args.strategies.split(',')
+    unknown = [s for s in strategies if s not in STRATEGIES]
+    if unknown:
+        parser.error(f"Unknown strategies {unknown}")
+    think = {
+        'median': args.median_pick, 'sigma': args.pick_sigma, 'player_sigma': args.player_sigma,
+        'absent_rate': args.absent_rate, 'autopick_delay': args.autopick_delay
+    }
+
+    started = time.perf_counter()
+    pool = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    try:
+        for turn_duration in (int(d) for d in args.turn_durations.split(',')):
+            for strategy in strategies:
+                results = run(args.drafts, args.players, args.rounds, ranks, turn_duration, strategy,
+                              think, args.batch_size, pool, args.seed)
+                report(turn_duration, strategy, *results, args.players * args.rounds)
+    finally:
+        if pool:
+            pool.shutdown()
+    print(f"Simulated {args.drafts} drafts per setting in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import logging
+from datetime import datetime
+
+from metrics import debug_sampled
+
+logger = logging.getLogger(__name__)
+
+
+def records_from_values(values):
+    """Turn a raw worksheet value grid into header-keyed records, like gspread's get_all_records."""
+    if not values:
+        return [], []
+    headers = values[0]
+    records = []
+    for row in values[1:]:
+        row = list(row) + [''] * (len(headers) - len(row))
+        records.append(dict(zip(headers, row)))
+    return headers, records
+
+
+class GolferTable(list):
+    """The golfer field sorted by ranking, with integer IDs (1 = best ranked) and rankings parsed once.
+
+    A list of the golfer records, so templates and the availability index use
+    it as before; the store caches one per golfer field, and snapshots reuse it
+    until the field changes.
+    """
+
+    def __init__(self, records):
+        super().__init__(records)
+        self.ids = {r['Golfer Name']: r['ID'] for r in records}
+
+    @classmethod
+    def from_records(cls, records):
+        if isinstance(records, cls):
+            return records
+        ranked = sorted(records, key=lambda x: int(x['Ranking']))
+        return cls([dict(r, ID=i) for i, r in enumerate(ranked, start=1)])
+
+
+class DraftSnapshot:
+    """Point-in-time view of both worksheets, parsed once into what the routes need.
+
+    Every loader reads from the same snapshot, so one refresh is one backend
+    fetch and all views of a request agree with each other. version is the
+    draft state version the records were read at; exact is False when a
+    pick may have landed during the read. A fallback snapshot is a cached
+    one served after a failed load.
+    """
+
+    def __init__(self, golfer_records, draft_headers, draft_records, default_players, version=0, previous=None, exact=True):
+        self.fetched_at = datetime.now()
+        self.version = version
+        self.exact = exact
+        self.fallback = False
+        self.golfer_records = golfer_records
+        if previous is not None and (previous.golfer_records is golfer_records or previous.golfer_records == golfer_records):
+            # Unchanged field: keep the sorted table (and anything indexed on it) from the last snapshot
+            self.golfers = previous.golfers
+        else:
+            self.golfers = GolferTable.from_records(golfer_records)
+        self.draft_headers = list(draft_headers)
+        self.draft_records = draft_records
+        self.players = {r.get('Player') for r in draft_records}
+        self.picks = self._parse_picks(draft_records)
+        self.draft_order = self._parse_draft_order(draft_records, default_players)
+        self.draft_start_time = self._parse_draft_start_time(draft_records)
+        # Rough in-memory footprint, used to cap how many drafts a process keeps open
+        self.approx_bytes = len(repr(golfer_records)) + len(repr(draft_records))
+
+    def has_player(self, player):
+        return player in self.players
+
+    @staticmethod
+    def _parse_picks(records):
+        picks = []
+        for record in records:
+            player = record.get('Player')
+            pick_time = record.get('Pick Time', '')
+            for pick_num in range(1, 4):
+                golfer = record.get(f'Pick {pick_num}')
+                if golfer:
+                    picks.append({
+                        'Player': player,
+                        'Golfer': golfer,
+                        'Pick Number': pick_num,
+                        'Pick Time': pick_time
+                    })
+        return picks
+
+    @staticmethod
+    def _parse_draft_order(records, default_players):
+        default_order = [{'Player': player} for player in default_players]
+        if not records:
+            logger.info("No records found in Draft Board, using default player mapping")
+            return default_order
+        order = [r for r in records if 'Player' in r and 'Draft Order' in r and r['Draft Order']]
+        if not order:
+            logger.info("No valid draft order entries, using default player mapping")
+            return default_order
+        try:
+            sorted_order = sorted(order, key=lambda x: int(float(str(x['Draft Order']).strip())))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Error parsing draft order: {str(e)}, falling back to default order")
+            return default_order
+        debug_sampled(logger, 20, "Draft order: %s", sorted_order)
+        return sorted_order
+
+    @staticmethod
+    def _parse_draft_start_time(records):
+        for record in records:
+            value = record.get('Draft Start Time')
+            if value:
+                try:
+                    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+                except ValueError as e:
+                    logger.error(f"Error parsing Draft Start Time '{value}': {str(e)}")
+        return None
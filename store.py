@@ -0,0 +1,697 @@
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from gspread.utils import rowcol_to_a1
+
+from metrics import BACKOFF_RETRIES
+from snapshot import GolferTable, records_from_values
+
+logger = logging.getLogger(__name__)
+
+
+class PickConflict(Exception):
+    """A pick lost a race: its slot or golfer is taken, or the draft moved on since it was validated."""
+
+
+def picks_from_records(records):
+    """(player, pick number, golfer) for every filled Pick column of the Draft Board."""
+    return [
+        (r.get('Player'), n, r[f'Pick {n}'])
+        for r in records for n in range(1, 4) if r.get(f'Pick {n}')
+    ]
+
+
+class SheetsDraftStore:
+    """Draft store that reads and writes the Google Sheet directly.
+
+    Player rows and header columns of the Draft Board are indexed once and
+    kept up to date from every full fetch, so a pick is a single batch_update.
+    Calls go through the optional SheetsRateLimiter; those on the pick path
+    are urgent, plain reads fail fast with RateLimited when over budget.
+    """
+
+    def __init__(self, golfers_worksheet, draft_worksheet, limiter=None):
+        self.golfers_worksheet = golfers_worksheet
+        self.draft_worksheet = draft_worksheet
+        self.limiter = limiter
+        self.version_lock = threading.Lock()
+        self.version = 0
+        # Picks written to the Sheet whose version bump has not happened yet
+        self.writes_in_flight = 0
+        # Digest of the last fetched worksheets and the version it was read at, to spot edits made in the Sheet itself
+        self.content_digest = None
+        self.digest_version = None
+        self.index_lock = threading.Lock()
+        self.column_lock = threading.Lock()
+        self.row_index = None
+        self.column_index = None
+        # Claimed (player, pick number) slots and golfers; only this process writes picks in 'sheets' mode
+        self.pick_lock = threading.Lock()
+        self.claimed_slots = {}
+        self.claimed_golfers = set()
+        self.pick_tokens = {}
+        # Pick queues live in this process only; the Sheet has nowhere to keep them
+        self.pick_queues = {}
+        self.queue_changes = 0
+
+    def _index_draft_board(self, draft_headers, draft_records):
+        with self.index_lock:
+            self.column_index = {header: i + 1 for i, header in enumerate(draft_headers) if header}
+            self.row_index = {r.get('Player'): i + 2 for i, r in enumerate(draft_records) if r.get('Player')}
+        with self.pick_lock:
+            # Claims only grow: a fetch that started before our last pick must not drop it
+            for player, pick_number, golfer in picks_from_records(draft_records):
+                self.claimed_slots[(player, pick_number)] = golfer
+                self.claimed_golfers.add(golfer)
+
+    def _call(self, kind, fn, *args, urgent=False, reserved=False, **kwargs):
+        if self.limiter is None:
+            return fn(*args, **kwargs)
+        return self.limiter.call(kind, fn, *args, urgent=urgent, reserved=reserved, **kwargs)
+
+    def _ensure_index(self):
+        if self.row_index is None:
+            values = self._call('read', self.draft_worksheet.get_all_values, urgent=True)
+            draft_headers, draft_records = records_from_values(values)
+            self._index_draft_board(draft_headers, draft_records)
+
+    def state_version(self):
+        return self.version
+
+    def bump_state_version(self):
+        with self.version_lock:
+            self.version += 1
+            return self.version
+
+    def queue_version(self):
+        return self.queue_changes
+
+    def bump_queue_version(self):
+        with self.pick_lock:
+            self.queue_changes += 1
+            return self.queue_changes
+
+    def fetch_versioned(self, urgent=False):
+        """fetch_all() with the state version read before it: (version, exact, golfer records, draft headers, draft records).
+
+        exact is False if a pick was being written meanwhile, so the records may already hold a later version's pick.
+        Records that changed while the version did not were edited directly in the Sheet: that bumps the version,
+        so ETags and rendered fragments keyed by it move on too.
+        This is the snapshot refresh, so it may spend the reserved slice of the read budget.
+        """
+        with self.version_lock:
+            version, in_flight = self.version, self.writes_in_flight
+        records = self.fetch_all(urgent, reserved=True)
+        digest = hash(json.dumps(records, sort_keys=True, default=str))
+        with self.version_lock:
+            exact = not in_flight and not self.writes_in_flight and self.version == version
+            if exact and self.digest_version == version and self.content_digest != digest:
+                self.version += 1
+                version = self.version
+                logger.info(f"Draft worksheets were edited in the Sheet, state version is now {version}")
+            self.content_digest, self.digest_version = digest, version
+        return (version, exact) + records
+
+    def fetch_all(self, urgent=False, reserved=False):
+        """Fetch both worksheets in one values batch_get: (golfer records, draft headers, draft records)."""
+        response = self._call(
+            'read', self.draft_worksheet.spreadsheet.values_batch_get,
+            [f"'{self.golfers_worksheet.title}'", f"'{self.draft_worksheet.title}'"], urgent=urgent, reserved=reserved
+        )
+        golfer_values, draft_values = (r.get('values', []) for r in response['valueRanges'])
+        _, golfer_records = records_from_values(golfer_values)
+        draft_headers, draft_records = records_from_values(draft_values)
+        self._index_draft_board(draft_headers, draft_records)
+        return golfer_records, draft_headers, draft_records
+
+    def golfer_records(self):
+        return self._call('read', self.golfers_worksheet.get_all_records)
+
+    def draft_headers(self, urgent=False):
+        return self._call('read', self.draft_worksheet.row_values, 1, urgent=urgent)
+
+    def replace_golfers(self, records):
+        """Overwrite the Golfers worksheet with the given records in one write, blanking any leftover rows."""
+        headers = ['ID', 'Golfer Name', 'Ranking', 'Odds']
+        values = [headers] + [[r.get(h) if r.get(h) is not None else '' for h in headers] for r in records]
+        values += [[''] * len(headers)] * max(0, self.golfers_worksheet.row_count - len(values))
+        self._call('write', self.golfers_worksheet.update, values, 'A1', urgent=True)
+
+    def draft_records(self):
+        return self._call('read', self.draft_worksheet.get_all_records)
+
+    def has_player(self, player):
+        self._ensure_index()
+        return player in self.row_index
+
+    def add_draft_column(self, name):
+        """Append a header column unless the Sheet already has it; returns True if it was added.
+
+        Answered from the column index when it already knows the column, so a
+        stale snapshot asking again costs no read.
+        """
+        # One at a time: concurrent adds would each read the same headers and write the same cell
+        with self.column_lock:
+            if self.column_index is not None and name in self.column_index:
+                return False
+            headers = self.draft_headers(urgent=True)
+            added = name not in headers
+            if added:
+                self._call('write', self.draft_worksheet.update_cell, 1, len(headers) + 1, name, urgent=True)
+                headers = headers + [name]
+            if self.column_index is not None:
+                with self.index_lock:
+                    self.column_index.update({header: i + 1 for i, header in enumerate(headers) if header})
+            return added
+
+    def set_draft_values(self, player, values):
+        """Write {column: value} into the given player's row of the Draft Board in one batch_update."""
+        self._ensure_index()
+        player_row = self.row_index.get(player)
+        if not player_row:
+            raise KeyError(f"Player {player} not found in draft board")
+        missing = [column for column in values if column not in self.column_index]
+        if missing:
+            raise KeyError(f"Columns {missing} not found in draft board")
+        self._call(
+            'write', self.draft_worksheet.batch_update,
+            [{'range': rowcol_to_a1(player_row, self.column_index[column]), 'values': [[value]]} for column, value in values.items()],
+            raw=False, urgent=True
+        )
+
+    def pick_queue(self, player):
+        with self.pick_lock:
+            return list(self.pick_queues.get(player, ()))
+
+    def set_pick_queue(self, player, golfers):
+        with self.pick_lock:
+            self.pick_queues[player] = list(golfers)
+
+    def pick_for_token(self, token):
+        """(player, pick number, golfer) committed with this pick token, or None."""
+        with self.pick_lock:
+            return self.pick_tokens.get(token)
+
+    def record_pick(self, player, pick_number, golfer, pick_time, source, expected_picks=None, token=None):
+        """Claim the slot and golfer, then write the pick; returns (state version, duplicate).
+
+        The Sheet keeps no event log, so source is not stored. Claims are held
+        in memory, which is enough because 'sheets' mode runs one process.
+        """
+        with self.pick_lock:
+            if token and token in self.pick_tokens:
+                if self.pick_tokens[token] != (player, pick_number, golfer):
+                    raise PickConflict("This pick token was already used for a different pick")
+                return self.version, True
+            if (player, pick_number) in self.claimed_slots:
+                raise PickConflict(f"Pick {pick_number} for {player} has already been made")
+            if golfer in self.claimed_golfers:
+                raise PickConflict(f"{golfer} has already been drafted")
+            if expected_picks is not None and len(self.claimed_slots) != expected_picks:
+                raise PickConflict("The draft moved on since this pick was validated")
+            self.claimed_slots[(player, pick_number)] = golfer
+            self.claimed_golfers.add(golfer)
+        with self.version_lock:
+            self.writes_in_flight += 1
+        try:
+            self.set_draft_values(player, {'Pick Time': pick_time, f'Pick {pick_number}': golfer})
+        except Exception:
+            with self.pick_lock:
+                del self.claimed_slots[(player, pick_number)]
+                self.claimed_golfers.discard(golfer)
+            with self.version_lock:
+                self.writes_in_flight -= 1
+            raise
+        if token:
+            with self.pick_lock:
+                self.pick_tokens[token] = (player, pick_number, golfer)
+        with self.version_lock:
+            self.writes_in_flight -= 1
+            self.version += 1
+            return self.version, False
+
+
+class _Board:
+    """Draft Board state at one point of the event log; replaced, never mutated, as events apply."""
+
+    def __init__(self, generation, event_id, headers, records, positions=None):
+        self.generation = generation
+        self.event_id = event_id
+        self.headers = headers
+        self.records = records
+        self.positions = positions if positions is not None else {r.get('Player'): i for i, r in enumerate(records)}
+
+    def apply(self, rows):
+        headers = list(self.headers)
+        records = list(self.records)
+        for _, kind, player, data in rows:
+            data = json.loads(data)
+            if kind == 'add_column':
+                if data['name'] not in headers:
+                    headers.append(data['name'])
+                continue
+            position = self.positions.get(player)
+            if position is None:
+                logger.error(f"Skipping {kind} event for unknown player {player}")
+                continue
+            records[position] = {**records[position], **data['values']}
+        return _Board(self.generation, rows[-1][0], headers, records, self.positions)
+
+
+class LocalDraftStore:
+    """SQLite-backed draft store that is the source of truth for the app.
+
+    Writes are committed locally and queued in an outbox table; a
+    SheetSyncWorker drains the outbox into the Google Sheet in the background,
+    so a Sheets outage only delays the mirror and never blocks the draft.
+
+    The database runs in WAL mode and every read-modify-write takes the write
+    lock up front (BEGIN IMMEDIATE), so several gunicorn workers can share one
+    file as their common draft state.
+
+    Every change to the Draft Board, and every pick with its source (pick,
+    autopick or admin), is appended to the draft_events log with an fsync'd
+    commit. The draft_board table is a compacted snapshot of that log, rewritten
+    every SNAPSHOT_EVERY events; reads replay only the events logged since the
+    last state this process saw, starting from the snapshot after a restart.
+    """
+
+    SNAPSHOT_EVERY = 25
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # FULL: the WAL is fsync'd on every commit, so an acknowledged pick survives a power loss
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS golfers (position INTEGER PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS draft_board (position INTEGER PRIMARY KEY, player TEXT UNIQUE, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS pick_claims (
+                player TEXT NOT NULL,
+                pick_number INTEGER NOT NULL,
+                golfer TEXT NOT NULL UNIQUE,
+                token TEXT UNIQUE,
+                PRIMARY KEY (player, pick_number)
+            );
+            CREATE TABLE IF NOT EXISTS pick_queues (
+                player TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                golfer TEXT NOT NULL,
+                PRIMARY KEY (player, position)
+            );
+            CREATE TABLE IF NOT EXISTS draft_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                player TEXT,
+                data TEXT NOT NULL,
+                source TEXT,
+                recorded_at TEXT NOT NULL
+            );
+        """)
+        self.outbox_event = threading.Event()
+        self.board = None
+        self.golfers = None
+
+    @contextmanager
+    def transaction(self, mode='IMMEDIATE'):
+        """Run a block in one SQLite transaction; IMMEDIATE takes the cross-process write lock up front."""
+        with self.lock:
+            if self.conn.in_transaction:
+                yield
+                return
+            self.conn.execute(f"BEGIN {mode}")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def is_seeded(self):
+        with self.lock:
+            return self._meta('draft_headers') is not None
+
+    def seed(self, golfer_records, draft_headers, draft_records):
+        """Replace the local copy of both worksheets with the given records.
+
+        A field loaded with import_golfers() is kept: it replaces the Sheet's Golfers worksheet, not the other way round.
+        """
+        with self.transaction():
+            if self._meta('field_imported') is not None:
+                golfer_records = list(self.golfer_rows())
+                logger.info(f"Keeping the imported field of {len(golfer_records)} golfers instead of the Sheet's")
+            self.conn.execute("DELETE FROM golfers")
+            self.conn.execute("DELETE FROM draft_board")
+            self.conn.executemany(
+                "INSERT INTO golfers (position, data) VALUES (?, ?)",
+                [(i, json.dumps(r)) for i, r in enumerate(golfer_records)]
+            )
+            self.conn.executemany(
+                "INSERT INTO draft_board (position, player, data) VALUES (?, ?, ?)",
+                [(i, r.get('Player'), json.dumps(r)) for i, r in enumerate(draft_records)]
+            )
+            self._set_meta('draft_headers', json.dumps(draft_headers))
+            # Events logged before this seed are history only; replay starts after them
+            last_event_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM draft_events").fetchone()[0]
+            self._set_meta('snapshot_event_id', str(last_event_id))
+            self._set_meta('seed_generation', str(int(self._meta('seed_generation', 0)) + 1))
+            self._set_meta('golfers_generation', str(int(self._meta('golfers_generation', 0)) + 1))
+        logger.info(f"Seeded local draft store with {len(golfer_records)} golfers and {len(draft_records)} draft rows")
+
+    def seed_from(self, source):
+        self.seed(*source.fetch_all(urgent=True))
+
+    def fetch_versioned(self):
+        """fetch_all() with the state version it was read at: (version, exact, golfer records, draft headers, draft records).
+
+        Both come from one read transaction, so exact is always True.
+        """
+        with self.transaction('DEFERRED'):
+            return (self.state_version(), True) + self.fetch_all()
+
+    def fetch_all(self):
+        # One read transaction, so all three come from the same commit even with other workers writing
+        with self.transaction('DEFERRED'):
+            board = self._board()
+            return self.golfer_records(), list(board.headers), board.records
+
+    def _board(self):
+        """Current Draft Board: the cached (or snapshot) state plus the events logged after it."""
+        with self.transaction('DEFERRED'):
+            generation = int(self._meta('seed_generation', 0))
+            board = self.board
+            if board is None or board.generation != generation:
+                rows = self.conn.execute("SELECT data FROM draft_board ORDER BY position").fetchall()
+                board = _Board(
+                    generation,
+                    int(self._meta('snapshot_event_id', 0)),
+                    json.loads(self._meta('draft_headers', '[]')),
+                    [json.loads(data) for (data,) in rows]
+                )
+            events = self.conn.execute(
+                "SELECT id, kind, player, data FROM draft_events WHERE id > ? ORDER BY id", (board.event_id,)
+            ).fetchall()
+            if events:
+                board = board.apply(events)
+            self.board = board
+            return board
+
+    def state_version(self):
+        with self.lock:
+            return int(self._meta('state_version', 0))
+
+    def bump_state_version(self):
+        """Advance the monotonic draft state version, persisted and shared by every worker process."""
+        with self.transaction():
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('state_version', '1') "
+                "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+            )
+            return self.state_version()
+
+    def queue_version(self):
+        with self.lock:
+            return int(self._meta('queue_version', 0))
+
+    def bump_queue_version(self):
+        """Signal a pick queue change to every worker without moving the draft state version."""
+        with self.transaction():
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('queue_version', '1') "
+                "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+            )
+            return self.queue_version()
+
+    def golfer_records(self):
+        """Golfer field as a ranking-sorted GolferTable, built once per seed or import."""
+        with self.transaction('DEFERRED'):
+            generation = int(self._meta('golfers_generation', 0))
+            if self.golfers is None or self.golfers[0] != generation:
+                rows = self.conn.execute("SELECT data FROM golfers ORDER BY position").fetchall()
+                self.golfers = (generation, GolferTable.from_records([json.loads(data) for (data,) in rows]))
+            return self.golfers[1]
+
+    def import_golfers(self, rows):
+        """Replace the golfer field with (name, ranking, odds) rows, streamed from any iterable.
+
+        Rows go straight into a staging table and SQLite sorts them into the
+        golfers table, so the import holds one row in memory at a time. Any
+        error raised while iterating rolls the whole import back.
+        """
+        with self.transaction():
+            self.conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS field_import (name TEXT PRIMARY KEY, ranking INTEGER NOT NULL, odds TEXT)"
+            )
+            self.conn.execute("DELETE FROM field_import")
+            try:
+                self.conn.executemany("INSERT INTO field_import (name, ranking, odds) VALUES (?, ?, ?)", rows)
+            except sqlite3.IntegrityError as e:
+                raise ValueError(f"Duplicate golfer in field: {str(e)}")
+            self.conn.execute("DELETE FROM golfers")
+            self.conn.execute(
+                "INSERT INTO golfers (position, data) "
+                "SELECT ROW_NUMBER() OVER (ORDER BY ranking, name) - 1, "
+                "json_object('ID', ROW_NUMBER() OVER (ORDER BY ranking, name), 'Golfer Name', name, 'Ranking', ranking, 'Odds', odds) "
+                "FROM field_import"
+            )
+            count = self.conn.execute("SELECT COUNT(*) FROM golfers").fetchone()[0]
+            self.conn.execute("DELETE FROM field_import")
+            self._set_meta('golfers_generation', str(int(self._meta('golfers_generation', 0)) + 1))
+            # Seeding from the Sheet (first boot of an empty store) must not overwrite this field
+            self._set_meta('field_imported', str(count))
+            self.bump_state_version()
+        logger.info(f"Imported {count} golfers into the local draft store")
+        return count
+
+    def golfer_rows(self):
+        """Golfer records in ranking order, one at a time."""
+        for (data,) in self.conn.execute("SELECT data FROM golfers ORDER BY position"):
+            yield json.loads(data)
+
+    def draft_headers(self):
+        return list(self._board().headers)
+
+    def draft_records(self):
+        return self._board().records
+
+    def has_player(self, player):
+        return player in self._board().positions
+
+    def add_draft_column(self, name):
+        """Append a header column unless the board already has it; returns True if it was added."""
+        with self.transaction():
+            if name in self._board().headers:
+                return False
+            self._append('add_column', None, {'name': name})
+            self._enqueue({'op': 'add_column', 'name': name})
+            return True
+
+    def set_draft_values(self, player, values):
+        with self.transaction():
+            if not self.has_player(player):
+                raise KeyError(f"Player {player} not found in draft board")
+            self._append('set', player, {'values': values})
+            self._enqueue({'op': 'set', 'player': player, 'values': values})
+
+    def record_pick(self, player, pick_number, golfer, pick_time, source, expected_picks=None, token=None):
+        """Atomically claim a pick's slot and golfer, log it and bump the state version.
+
+        Compare-and-set in one short write transaction: the (player, pick number)
+        slot and the golfer are unique keys of pick_claims, and expected_picks,
+        if given, must still equal the number of picks made. A token already
+        committed for the same pick is a retry and succeeds without writing.
+        Returns (state version, duplicate); raises PickConflict otherwise.
+        """
+        values = {'Pick Time': pick_time, f'Pick {pick_number}': golfer}
+        with self.transaction():
+            self._sync_claims()
+            if token:
+                row = self.conn.execute("SELECT player, pick_number, golfer FROM pick_claims WHERE token = ?", (token,)).fetchone()
+                if row:
+                    if tuple(row) != (player, pick_number, golfer):
+                        raise PickConflict("This pick token was already used for a different pick")
+                    return self.state_version(), True
+            if not self.has_player(player):
+                raise KeyError(f"Player {player} not found in draft board")
+            if expected_picks is not None:
+                made = self.conn.execute("SELECT COUNT(*) FROM pick_claims").fetchone()[0]
+                if made != expected_picks:
+                    raise PickConflict("The draft moved on since this pick was validated")
+            try:
+                self.conn.execute(
+                    "INSERT INTO pick_claims (player, pick_number, golfer, token) VALUES (?, ?, ?, ?)",
+                    (player, pick_number, golfer, token or None)
+                )
+            except sqlite3.IntegrityError:
+                if self.conn.execute("SELECT 1 FROM pick_claims WHERE golfer = ?", (golfer,)).fetchone():
+                    raise PickConflict(f"{golfer} has already been drafted")
+                raise PickConflict(f"Pick {pick_number} for {player} has already been made")
+            self._append('pick', player, {'values': values, 'pick_number': pick_number, 'golfer': golfer}, source)
+            self._enqueue({'op': 'set', 'player': player, 'values': values})
+            return self.bump_state_version(), False
+
+    def pick_for_token(self, token):
+        """(player, pick number, golfer) committed with this pick token, or None."""
+        with self.lock:
+            row = self.conn.execute("SELECT player, pick_number, golfer FROM pick_claims WHERE token = ?", (token,)).fetchone()
+        return tuple(row) if row else None
+
+    def _sync_claims(self):
+        """Rebuild pick_claims from the board after a (re)seed; the claims otherwise only grow with picks."""
+        generation = self._meta('seed_generation', '0')
+        if self._meta('claims_generation') == generation:
+            return
+        self.conn.execute("DELETE FROM pick_claims")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO pick_claims (player, pick_number, golfer) VALUES (?, ?, ?)",
+            picks_from_records(self._board().records)
+        )
+        self._set_meta('claims_generation', generation)
+
+    def pick_queue(self, player):
+        """The player's queued golfers, most wanted first."""
+        with self.lock:
+            rows = self.conn.execute("SELECT golfer FROM pick_queues WHERE player = ? ORDER BY position", (player,)).fetchall()
+        return [golfer for (golfer,) in rows]
+
+    def set_pick_queue(self, player, golfers):
+        with self.transaction():
+            self.conn.execute("DELETE FROM pick_queues WHERE player = ?", (player,))
+            self.conn.executemany(
+                "INSERT INTO pick_queues (player, position, golfer) VALUES (?, ?, ?)",
+                [(player, i, golfer) for i, golfer in enumerate(golfers)]
+            )
+
+    def pick_history(self):
+        """Audit trail of every pick logged since the store was created, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT id, player, data, source, recorded_at FROM draft_events WHERE kind = 'pick' ORDER BY id"
+            ).fetchall()
+        history = []
+        for event_id, player, data, source, recorded_at in rows:
+            data = json.loads(data)
+            history.append({
+                'Event': event_id,
+                'Player': player,
+                'Pick Number': data['pick_number'],
+                'Golfer': data['golfer'],
+                'Pick Time': data['values']['Pick Time'],
+                'Source': source,
+                'Recorded At': recorded_at
+            })
+        return history
+
+    def _append(self, kind, player, data, source=None):
+        """Append one event (inside the caller's transaction) and compact the log into a snapshot when due."""
+        event_id = self.conn.execute(
+            "INSERT INTO draft_events (kind, player, data, source, recorded_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, player, json.dumps(data), source, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        ).lastrowid
+        if event_id - int(self._meta('snapshot_event_id', 0)) >= self.SNAPSHOT_EVERY:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the draft_board snapshot to the current state; events stay as the audit trail."""
+        board = self._board()
+        self.conn.executemany(
+            "UPDATE draft_board SET data = ? WHERE position = ?",
+            [(json.dumps(r), i) for i, r in enumerate(board.records)]
+        )
+        self._set_meta('draft_headers', json.dumps(board.headers))
+        self._set_meta('snapshot_event_id', str(board.event_id))
+        logger.info(f"Compacted draft event log into a snapshot at event {board.event_id}")
+
+    def _enqueue(self, op):
+        self.conn.execute("INSERT INTO outbox (data) VALUES (?)", (json.dumps(op),))
+        self.outbox_event.set()
+
+    def next_outbox(self):
+        with self.lock:
+            row = self.conn.execute("SELECT id, data FROM outbox ORDER BY id LIMIT 1").fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def ack_outbox(self, op_id):
+        with self.transaction():
+            self.conn.execute("DELETE FROM outbox WHERE id = ?", (op_id,))
+
+    def outbox_size(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class SheetSyncWorker(threading.Thread):
+    """Background thread that mirrors the local store's outbox to the Sheet in order."""
+
+    def __init__(self, local_store, sheets_store, retry_delay=5, max_retry_delay=120):
+        super().__init__(name='sheet-sync', daemon=True)
+        self.local_store = local_store
+        self.sheets_store = sheets_store
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.stopped = threading.Event()
+
+    def stop(self):
+        self.stopped.set()
+        self.local_store.outbox_event.set()
+
+    def apply(self, op):
+        if op['op'] == 'set':
+            self.sheets_store.set_draft_values(op['player'], op['values'])
+        elif op['op'] == 'add_column':
+            self.sheets_store.add_draft_column(op['name'])
+        else:
+            logger.error(f"Dropping unknown outbox operation: {op}")
+
+    def run(self):
+        delay = self.retry_delay
+        while not self.stopped.is_set():
+            item = self.local_store.next_outbox()
+            if item is None:
+                self.local_store.outbox_event.wait(timeout=30)
+                self.local_store.outbox_event.clear()
+                continue
+            op_id, op = item
+            try:
+                self.apply(op)
+            except Exception as e:
+                logger.error(f"Sheet sync failed for {op}, retrying in {delay}s: {str(e)}")
+                BACKOFF_RETRIES.inc(function='sheet_sync')
+                self.stopped.wait(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+                continue
+            self.local_store.ack_outbox(op_id)
+            delay = self.retry_delay
+            logger.info(f"Synced {op} to Google Sheet")
+
+
+def create_store(backend, golfers_worksheet, draft_worksheet, db_path='draft.db', limiter=None):
+    """Build the configured draft store and, for 'sqlite', its (not yet started) Sheet sync worker."""
+    sheets_store = SheetsDraftStore(golfers_worksheet, draft_worksheet, limiter)
+    if backend == 'sheets':
+        return sheets_store, None
+    local_store = LocalDraftStore(db_path)
+    # Workers booting together must not all seed from the Sheet
+    with local_store.transaction():
+        if not local_store.is_seeded():
+            local_store.seed_from(sheets_store)
+    return local_store, SheetSyncWorker(local_store, sheets_store)
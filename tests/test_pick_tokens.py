@@ -0,0 +1,103 @@
+"""A resubmitted pick (same pick_token) is treated as done, not re-validated against the new turn."""
+import importlib
+import os
+import sys
+
+import gspread
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sheets_client  # noqa: E402
+from fake_sheets import FakeClient, FakeSheetsBackend, draft_worksheets  # noqa: E402
+from store import LocalDraftStore, PickConflict, SheetsDraftStore  # noqa: E402
+
+PLAYERS = ['Stephen', 'Jason', 'Josh']
+
+
+def sheets_store():
+    client = FakeClient(FakeSheetsBackend(), lambda key: draft_worksheets(PLAYERS, field_size=10))
+    spreadsheet = client.open_by_key('test')
+    store = SheetsDraftStore(spreadsheet.worksheet('Golfers'), spreadsheet.worksheet('Draft Board'))
+    store.add_draft_column('Pick Time')
+    return store
+
+
+def local_store():
+    store = LocalDraftStore(':memory:')
+    store.seed_from(sheets_store())
+    return store
+
+
+@pytest.mark.parametrize('make_store', [sheets_store, local_store])
+def test_pick_for_token(make_store):
+    store = make_store()
+    assert store.pick_for_token('token-1') is None
+    _, duplicate = store.record_pick('Stephen', 1, 'Golfer 001', '2025-06-08 20:00:00', 'pick', 0, 'token-1')
+    assert not duplicate
+    assert store.pick_for_token('token-1') == ('Stephen', 1, 'Golfer 001')
+    _, duplicate = store.record_pick('Stephen', 1, 'Golfer 001', '2025-06-08 20:00:05', 'pick', 0, 'token-1')
+    assert duplicate
+    with pytest.raises(PickConflict):
+        store.record_pick('Stephen', 1, 'Golfer 002', '2025-06-08 20:00:05', 'pick', 1, 'token-1')
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """A fresh import of app.py on a fake Sheets backend, with its files under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    for name, value in {
+        'SERVICE_ACCOUNT_JSON': '{}',
+        'SPREADSHEET_ID': 'test',
+        'SECRET_KEY': 'test',
+        'DRAFT_STORE': 'sqlite',
+        'DRAFT_DB_PATH': str(tmp_path / 'draft.db'),
+        'LEAGUES_FILE': '',
+        'PREWARM_DRAFTS': 'false',
+    }.items():
+        monkeypatch.setenv(name, value)
+    client = FakeClient(FakeSheetsBackend(), lambda key: draft_worksheets(list(sys.modules['app'].user_player_mapping.values()), field_size=20))
+    monkeypatch.setattr(sheets_client.Credentials, 'from_service_account_info', staticmethod(lambda info, scopes=None: None))
+    monkeypatch.setattr(gspread, 'authorize', lambda credentials: client)
+    monkeypatch.delitem(sys.modules, 'app', raising=False)
+    module = importlib.import_module('app')
+    yield module
+    for draft in module.drafts.open_drafts():
+        draft.close()
+
+
+def login(app, username):
+    client = app.app.test_client()
+    client.post('/login', data={'username': username, 'password': app.USER_CREDENTIALS[username]})
+    client.get('/index')
+    return client
+
+
+def flashes(client):
+    with client.session_transaction() as session:
+        return session.get('_flashes', [])
+
+
+def test_resubmitted_pick_is_a_success(app):
+    draft = app.drafts.get(app.DEFAULT_DRAFT_ID)
+    client = login(app, 'user1')
+    form = {'golfer': 'Golfer 001', 'pick_token': 'resubmit-token'}
+
+    response = client.post('/pick', data=form)
+    assert response.status_code == 302
+    assert flashes(client) == []
+    assert draft.store.pick_for_token('resubmit-token') == ('Stephen', 1, 'Golfer 001')
+
+    # The turn has moved on to Jason, so a re-validated retry would be "Not your turn"
+    response = client.post('/pick', data=form)
+    assert response.status_code == 302
+    assert flashes(client) == []
+    assert len(draft.store.pick_history()) == 1
+
+
+def test_token_reused_by_another_player_is_rejected(app):
+    login(app, 'user1').post('/pick', data={'golfer': 'Golfer 001', 'pick_token': 'shared-token'})
+    client = login(app, 'user2')
+    client.post('/pick', data={'golfer': 'Golfer 002', 'pick_token': 'shared-token'})
+    assert [message for _, message in flashes(client)] == ['This pick token was already used for a different pick']
+    assert len(app.drafts.get(app.DEFAULT_DRAFT_ID).store.pick_history()) == 1